@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorized colorspace engine against per-color conversions.
+
+Usage: ``python benchmarks/colorspace.py``
+"""
+import timeit
+
+import numpy as np
+
+import proplot as pplt
+from proplot.externals import hsluv
+
+SIZES = (256, 1024, 65536)
+SPACES = {
+    'hsv': hsluv.hsl_to_rgb,
+    'hcl': hsluv.hcl_to_rgb,
+    'hsl': hsluv.hsluv_to_rgb,
+    'hpl': hsluv.hpluv_to_rgb,
+}
+
+
+def _time(func, number=3):
+    return min(timeit.repeat(func, number=1, repeat=number))
+
+
+def main():
+    state = np.random.RandomState(51423)
+    print('Lookup table conversion (scalar loop vs. vectorized):')
+    for space, scalar in SPACES.items():
+        for N in SIZES:
+            lut = state.rand(N, 3) * [360, 100, 100]
+            t1 = _time(lambda: [scalar(*row) for row in lut], number=1)
+            t2 = _time(lambda: pplt.utils._to_rgb_array(lut, space))
+            print(f'{space} N={N:>6d}: {t1:.4f}s vs. {t2:.4f}s ({t1 / t2:.0f}x)')
+    print('PerceptualColormap construction:')
+    for N in SIZES:
+        t = _time(lambda: pplt.PerceptualColormap.from_hsl(
+            hue=(0, 360), saturation=(90, 40), luminance=(90, 20), N=N
+        ))
+        print(f'N={N:>6d}: {t:.4f}s')
+
+
+if __name__ == '__main__':
+    main()
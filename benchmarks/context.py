@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark the overhead of `rc.context` blocks and `Axes.format` calls
+and the setting lookup cache hits inside `Axes.format` calls.
+
+Usage: ``python benchmarks/context.py``
+"""
+import timeit
+
+import proplot as pplt
+
+NUMBER = 200
+
+
+def _time(func, number=3):
+    return min(timeit.repeat(func, number=NUMBER, repeat=number)) / NUMBER
+
+
+def _context(**kwargs):
+    with pplt.rc.context(**kwargs):
+        pass
+
+
+def _hits(func):
+    # Count the lookups and cache misses by shadowing the methods on the instance
+    rc = pplt.rc
+    counts = [0, 0]
+    cached, source = rc._get_item_cached, rc._get_item_context_source
+
+    def _get_item_cached(key, mode):
+        counts[0] += 1
+        return cached(key, mode)
+
+    def _get_item_context_source(key, mode):
+        counts[1] += 1
+        return source(key, mode)
+
+    rc._get_item_cached = _get_item_cached
+    rc._get_item_context_source = _get_item_context_source
+    try:
+        func()
+    finally:
+        for name in ('_get_item_cached', '_get_item_context_source'):
+            object.__delattr__(rc, name)  # rc.__delattr__ forbids deletion
+    return counts[0], counts[0] - counts[1]
+
+
+def main():
+    print('Context block enter and exit time:')
+    for kwargs in (
+        {},
+        {'ticklen': 5},
+        {'ticklen': 5, 'metalinewidth': 2, 'fontsize': 12, 'grid': False},
+    ):
+        t = _time(lambda: _context(**kwargs))
+        print(f'{len(kwargs)} settings: {t * 1e6:.1f}us')
+    print('Format call time:')
+    fig, axs = pplt.subplots()
+    ax = axs[0]
+    for name, kwargs in (
+        ('no settings', {}),
+        ('format keywords', {'xlabel': 'x', 'ylabel': 'y', 'title': 'title'}),
+        ('rc keywords', {'ticklen': 5, 'metalinewidth': 2, 'fontsize': 12}),
+        ('rc dictionary', {'rc_kw': {'tick.len': 5, 'grid': False}}),
+    ):
+        t = _time(lambda: ax.format(**kwargs))
+        print(f'{name + ":":<16s} {t * 1e3:.3f}ms')
+    print('Setting lookup cache hits in repeated format calls:')
+    for name, kwargs in (
+        ('no settings', {}),
+        ('format keywords', {'xlabel': 'x', 'ylabel': 'y', 'title': 'title'}),
+    ):
+        ax.format(**kwargs)
+        total, hits = _hits(lambda: ax.format(**kwargs))
+        print(f'{name + ":":<16s} {hits}/{total} lookups')
+    pplt.close(fig)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cutoff scale transform for arrays of increasing size.
+
+Usage: ``python benchmarks/cutoff.py``
+"""
+import timeit
+
+import numpy as np
+
+import proplot as pplt
+
+SIZES = (1000, 10000, 100000, 1000000, 10000000)
+LOOP_SIZE = 100000  # largest size timed with the previous element-wise loop
+
+
+def _time(func, number=3):
+    return min(timeit.repeat(func, number=1, repeat=number))
+
+
+def _transform_loop(transform, a):
+    # The previous element-wise implementation
+    dists = transform._dists
+    scales = transform._scales
+    threshs = transform._threshs
+    aa = np.array(a)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for i, ai in np.ndenumerate(a):
+            j = np.searchsorted(threshs, ai)
+            if j > 0:
+                aa[i] = dists[:j].sum() + (ai - threshs[j - 1]) / scales[j - 1]
+    return aa
+
+
+def main():
+    state = np.random.RandomState(51423)
+    scale = pplt.CutoffScale(10, 0.5, 20, np.inf, 30, 2)
+    for name, transform in (
+        ('Forward', scale.get_transform()),
+        ('Inverse', scale.get_transform().inverted()),
+    ):
+        print(f'{name} transform time (loop vs. vectorized):')
+        for N in SIZES:
+            a = state.uniform(0, 50, N)
+            t2 = _time(lambda: transform.transform_non_affine(a))
+            if N > LOOP_SIZE:
+                print(f'N={N:>8d}: skipped vs. {t2:.4f}s')
+                continue
+            t1 = _time(lambda: _transform_loop(transform, a), number=1)
+            print(f'N={N:>8d}: {t1:.4f}s vs. {t2:.4f}s ({t1 / t2:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
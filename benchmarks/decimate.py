@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark line decimation render times and output file sizes.
+
+Usage: ``python benchmarks/decimate.py``
+"""
+import io
+import timeit
+
+import numpy as np
+
+import proplot as pplt
+
+SIZES = (100000, 1000000, 10000000)
+FORMATS = ('png', 'pdf', 'svg')
+
+
+def _time(func, number=3):
+    return min(timeit.repeat(func, number=1, repeat=number))
+
+
+def _data(N):
+    state = np.random.RandomState(51423)
+    x = np.linspace(0, 100, N)
+    y = np.sin(x) + state.randn(N).cumsum() * 0.001
+    return x, y
+
+
+def _figure(x, y, xlim=None, **kwargs):
+    fig, axs = pplt.subplots()
+    axs[0].plot(x, y, lw=0.5, **kwargs)
+    if xlim is not None:
+        axs.format(xlim=xlim)
+    return fig
+
+
+def _save(fig, fmt):
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt, dpi=300)
+    return len(buf.getvalue())
+
+
+def main():
+    print('Render time and size (decimate=False vs. decimate=True):')
+    for N in SIZES:
+        x, y = _data(N)
+        fig1, fig2 = _figure(x, y), _figure(x, y, decimate=True)
+        for fmt in FORMATS:
+            s1, s2 = _save(fig1, fmt), _save(fig2, fmt)
+            t1 = _time(lambda: _save(fig1, fmt))
+            t2 = _time(lambda: _save(fig2, fmt))
+            print(
+                f'{fmt} N={N:>8d}: {t1:.3f}s vs. {t2:.3f}s ({t1 / t2:.1f}x), '
+                f'{s1 / 1e3:.0f}kB vs. {s2 / 1e3:.0f}kB'
+            )
+        pplt.close(fig1)
+        pplt.close(fig2)
+    print('Render time when zoomed in (decimate=False vs. decimate=True):')
+    for N in SIZES:
+        x, y = _data(N)
+        fig1 = _figure(x, y, xlim=(10, 20))
+        fig2 = _figure(x, y, xlim=(10, 20), decimate=True)
+        t1 = _time(lambda: _save(fig1, 'png'))
+        t2 = _time(lambda: _save(fig2, 'png'))
+        print(f'png N={N:>8d}: {t1:.3f}s vs. {t2:.3f}s ({t1 / t2:.1f}x)')
+        pplt.close(fig1)
+        pplt.close(fig2)
+
+
+if __name__ == '__main__':
+    main()
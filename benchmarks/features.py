@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark cartopy geographic feature draw times for subplots sharing a projection.
+
+Usage: ``python benchmarks/features.py``
+"""
+import io
+import time
+
+import proplot as pplt
+from proplot.internals import caches
+
+PANS = (-120, -90, -60, -30)
+FEATURES = {'coast': True, 'land': True, 'borders': True, 'reso': 'med'}
+
+
+def _draw(fig):
+    t = time.perf_counter()
+    fig.savefig(io.BytesIO(), format='png')
+    return time.perf_counter() - t
+
+
+def _clear():
+    # NOTE: Also clear the cartopy path caches so each case starts from scratch.
+    from cartopy.mpl.feature_artist import FeatureArtist
+    caches.clear('features')
+    for name in ('_geom_key_to_geometry_cache', '_geom_key_to_path_cache'):
+        getattr(FeatureArtist, name, {}).clear()
+
+
+def main():
+    print('Draw time with 6 identical subplots (geo.featurecache=0 vs. 16):')
+    for lonlim in (None, (-120, 60)):
+        times = []
+        for size in (0, 16):
+            _clear()
+            with pplt.rc.context({'geo.featurecache': size}):
+                fig, axs = pplt.subplots(ncols=3, nrows=2, proj='robin')
+                axs.format(lonlim=lonlim, **FEATURES)
+                t, r = _draw(fig), _draw(fig)
+                p = 0
+                for lon0 in PANS:  # pan the map
+                    axs.format(lonlim=(lon0, lon0 + 120), latlim=(-60, 60))
+                    p += _draw(fig)
+                times.append((t, r, p))
+            pplt.close(fig)
+        (t1, r1, p1), (t2, r2, p2) = times
+        name = 'global' if lonlim is None else 'regional'
+        print(
+            f'{name + ":":<10s} first draw {t1:.3f}s vs. {t2:.3f}s, '
+            f'redraw {r1:.3f}s vs. {r2:.3f}s, panning {p1:.3f}s vs. {p2:.3f}s'
+        )
+    print('Cache statistics:', caches.info('features'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark peak memory and times for preparing global 2D data for geographic axes.
+
+Usage: ``python benchmarks/geomemory.py``
+"""
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from proplot.internals import inputs
+
+RESOLUTIONS = (1, 0.5, 0.25)
+
+
+def _time(func, number=3):
+    return min(timeit.repeat(func, number=1, repeat=number))
+
+
+def _data(res):
+    lon = np.arange(res / 2, 360, res)  # requires rolling to -180 to 180
+    lat = np.arange(-90 + res / 2, 90, res)
+    state = np.random.RandomState(51423)
+    return lon, lat, state.rand(lat.size, lon.size)
+
+
+def _peak(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    print('Peak memory and time relative to data size (globe=False vs. globe=True):')
+    for backend in ('basemap', 'cartopy'):
+        func = getattr(inputs, f'_geo_{backend}_2d')
+        for res in RESOLUTIONS:
+            x, y, z = _data(res)
+            p1, p2 = (_peak(lambda: func(x, y, z, globe=b)) for b in (False, True))
+            t1, t2 = (_time(lambda: func(x, y, z, globe=b)) for b in (False, True))
+            p1, p2 = p1 / z.nbytes, p2 / z.nbytes
+            print(
+                f'{backend} {res:<4g}deg: {p1:.1f}x vs. {p2:.1f}x '
+                f'({z.nbytes / 1e6:.0f}MB), {t1:.3f}s vs. {t2:.3f}s'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Benchmark cartopy gridliner updates and draw times for repeated draws.
+
+Usage: ``python benchmarks/gridliner.py``
+"""
+import io
+import os
+import time
+
+os.environ['PROPLOT_BENCHMARK'] = '1'  # record gridliner updates
+
+import proplot as pplt  # noqa: E402
+from proplot.internals import benchmarks  # noqa: E402
+
+PROJS = ('robin', 'npstere', 'ortho', 'lcc', 'eqearth', 'cyl')
+
+
+def _draw(fig):
+    benchmarks.reset()
+    t = time.perf_counter()
+    fig.savefig(io.BytesIO(), format='png')
+    t = time.perf_counter() - t
+    record = benchmarks.report()['phases'].get('gridliner', {})
+    return t, record.get('count', 0), record.get('time', 0.0)
+
+
+def main():
+    fig, axs = pplt.subplots(ncols=3, nrows=2, proj=PROJS)
+    axs.format(lonlines=30, latlines=30, labels=True)
+    ngl = 2 * len(PROJS)
+    print(f'Draw time and gridliner updates ({ngl} gridliners):')
+    for name, func in (
+        ('first draw', None),
+        ('redraw', None),
+        ('after format', lambda: axs.format(lonlines=60)),
+        ('after resize', lambda: fig.set_size_inches(8, 5)),
+        ('redraw', None),
+    ):
+        if func is not None:
+            func()
+        t, count, tgl = _draw(fig)
+        print(f'{name + ":":<14s} {t:.3f}s, {count} updates ({tgl:.3f}s)')
+    pplt.close(fig)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-call overhead of the internal keyword argument utilities.
+
+Usage: ``python benchmarks/kwargs.py``
+"""
+import inspect
+import timeit
+
+import proplot as pplt
+from proplot.internals import _alias_maps, _not_none, _pop_params, _pop_props
+
+NUMBER = 10000
+
+
+def _time(func, number=3):
+    return min(timeit.repeat(func, number=NUMBER, repeat=number)) / NUMBER
+
+
+def _pop_params_uncached(kwargs, *funcs):
+    # The previous signature lookup on every call
+    output = {}
+    for func in funcs:
+        for key in inspect.signature(func).parameters:
+            value = kwargs.pop(key, None)
+            if value is not None:
+                output[key] = value
+    return output
+
+
+def _pop_props_uncached(input, *categories):
+    # The previous iteration over every registered alias
+    output = {}
+    for category in categories:
+        for key, aliases in _alias_maps[category].items():
+            aliases = (aliases,) if isinstance(aliases, str) else aliases
+            opts = {alias: input.pop(alias, None) for alias in (key, *aliases)}
+            prop = _not_none(**opts)
+            if prop is not None:
+                output[key] = prop
+    return output
+
+
+def main():
+    fig, axs = pplt.subplots()
+    ax = axs[0]
+    kwargs = {'cmap': 'viridis', 'levels': 10, 'c': 'red', 'lw': 2, 'foo': 1}
+    funcs = (ax._parse_cmap, ax._parse_level_vals, ax._parse_level_num)
+    print('Per-call time for _pop_params (uncached vs. cached):')
+    t1 = _time(lambda: _pop_params_uncached(dict(kwargs), *funcs))
+    t2 = _time(lambda: _pop_params(dict(kwargs), *funcs))
+    print(f'{t1 * 1e6:.2f}us vs. {t2 * 1e6:.2f}us ({t1 / t2:.1f}x)')
+    print('Per-call time for _pop_props (all aliases vs. lookup table):')
+    for categories in (('line',), ('line', 'collection', 'patch'), ('text',)):
+        t1 = _time(lambda: _pop_props_uncached(dict(kwargs), *categories))
+        t2 = _time(lambda: _pop_props(dict(kwargs), *categories))
+        print(
+            f'{", ".join(categories):<24s}: '
+            f'{t1 * 1e6:.2f}us vs. {t2 * 1e6:.2f}us ({t1 / t2:.1f}x)'
+        )
+    pplt.close(fig)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark parametric line segment construction and decimation.
+
+Usage: ``python benchmarks/parametric.py``
+"""
+import timeit
+
+import numpy as np
+
+import proplot as pplt
+
+SIZES = (10000, 100000, 1000000)
+LOOP_MAX = 100000  # skip the per-point loop for larger sizes
+
+
+def _time(func, number=3):
+    return min(timeit.repeat(func, number=1, repeat=number))
+
+
+def _segments_loop(x, y):
+    # The previous per-point segment construction
+    coords = []
+    for i in range(y.shape[0]):
+        icoords = np.empty((3, 2))
+        for j, arr in enumerate((x, y)):
+            icoords[:, j] = (
+                arr[0] if i == 0 else 0.5 * (arr[i - 1] + arr[i]),
+                arr[i],
+                arr[-1] if i + 1 == y.shape[0] else 0.5 * (arr[i + 1] + arr[i]),
+            )
+        coords.append(icoords)
+    return np.array(coords)
+
+
+def _parametric(N, draw=False, **kwargs):
+    state = np.random.RandomState(51423)
+    t = np.linspace(0, 20 * np.pi, N)
+    x = np.cos(t) * t + state.randn(N).cumsum() * 0.01
+    y = np.sin(t) * t + state.randn(N).cumsum() * 0.01
+    fig, ax = pplt.subplots()
+    ax.parametric(x, y, t, **kwargs)
+    if draw:
+        fig.canvas.draw()
+    pplt.close(fig)
+
+
+def main():
+    print('Segment construction (per-point loop vs. parametric):')
+    for N in SIZES:
+        x, y = np.random.rand(2, N)
+        t1 = _time(lambda: _segments_loop(x, y), number=1) if N <= LOOP_MAX else np.nan
+        t2 = _time(lambda: _parametric(N))
+        print(f'N={N:>7d}: {t1:.4f}s vs. {t2:.4f}s')
+    print('Parametric with drawing (decimate=False vs. decimate=True):')
+    for N in SIZES:
+        t1 = _time(lambda: _parametric(N, draw=True), number=1)
+        t2 = _time(lambda: _parametric(N, draw=True, decimate=True), number=1)
+        print(f'N={N:>7d}: {t1:.4f}s vs. {t2:.4f}s ({t1 / t2:.1f}x)')
+    print('Parametric with interpolation (interp=5):')
+    for N in SIZES[:2]:
+        t = _time(lambda: _parametric(N, interp=5))
+        print(f'N={N:>7d}: {t:.4f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark tick label formatting for single calls and figure redraws.
+
+Usage: ``python benchmarks/ticker.py``
+"""
+import io
+import timeit
+
+import matplotlib.ticker as mticker
+import numpy as np
+
+import proplot as pplt
+
+NUMBER = 200
+
+
+def _time(func, number=3, repeat=NUMBER):
+    return min(timeit.repeat(func, number=repeat, repeat=number)) / repeat
+
+
+def _format_each(formatter, values):
+    # The previous one-value-at-a-time formatting
+    return mticker.Formatter.format_ticks(formatter, values)
+
+
+def _format_uncached(formatter, values):
+    formatter._ticks_cache.clear()
+    return formatter.format_ticks(values)
+
+
+def main():
+    fig, axs = pplt.subplots()
+    axs.format(xlim=(-1, 1))
+    values = np.linspace(-1, 1, 11)
+    print('Format time for 11 ticks (each value vs. all values vs. memoized):')
+    for formatter in (
+        pplt.AutoFormatter(),
+        pplt.SciFormatter(),
+        pplt.SigFigFormatter(),
+        pplt.FracFormatter(),
+    ):
+        formatter.set_axis(axs[0].xaxis)
+        formatter.format_ticks(values)
+        t1 = _time(lambda: _format_each(formatter, values))
+        t2 = _time(lambda: _format_uncached(formatter, values))
+        t3 = _time(lambda: formatter.format_ticks(values))
+        print(
+            f'{type(formatter).__name__ + ":":<17s} {t1 * 1e6:.0f}us vs. '
+            f'{t2 * 1e6:.0f}us vs. {t3 * 1e6:.0f}us'
+        )
+    pplt.close(fig)
+    print('Tick update time for a 4x4 grid (uncached vs. memoized):')
+    fig, axs = pplt.subplots(nrows=4, ncols=4)
+    fig.savefig(io.BytesIO(), format='png')
+    axises = [axis for ax in axs for axis in (ax.xaxis, ax.yaxis)]
+    formatters = [axis.get_major_formatter() for axis in axises]
+
+    def _update_ticks(clear=False):
+        if clear:
+            for formatter in formatters:
+                formatter._ticks_cache.clear()
+        for axis in axises:
+            axis._update_ticks()
+
+    t1 = _time(lambda: _update_ticks(clear=True), repeat=20)
+    t2 = _time(_update_ticks, repeat=20)
+    print(f'{t1 * 1e3:.1f}ms vs. {t2 * 1e3:.1f}ms')
+    pplt.close(fig)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,8 @@
 A succinct matplotlib wrapper for making beautiful, publication-quality graphics.
 """
 # SCM versioning
+import sys
+
 import pkg_resources as pkg
 name = 'proplot'
 try:
@@ -15,22 +17,10 @@ from . import internals, externals, tests  # noqa: F401
 from .internals.benchmarks import _benchmark
 with _benchmark('pyplot'):
     from matplotlib import pyplot  # noqa: F401
-with _benchmark('cartopy'):
-    try:
-        import cartopy  # noqa: F401
-    except ImportError:
-        pass
-with _benchmark('basemap'):
-    try:
-        from mpl_toolkits import basemap  # noqa: F401
-    except ImportError:
-        pass
 
 # Import everything to top level
 with _benchmark('config'):
     from .config import *  # noqa: F401 F403
-with _benchmark('proj'):
-    from .proj import *  # noqa: F401 F403
 with _benchmark('utils'):
     from .utils import *  # noqa: F401 F403
 with _benchmark('colors'):
@@ -53,47 +43,81 @@ with _benchmark('demos'):
     from .demos import *  # noqa: F401 F403
 
 # Dynamically add registered classes to top-level namespace
-from . import proj as crs  # backwards compatibility  # noqa: F401
 from .constructor import NORMS, LOCATORS, FORMATTERS, SCALES, PROJS
 _globals = globals()
-for _src in (NORMS, LOCATORS, FORMATTERS, SCALES, PROJS):
+for _src in (NORMS, LOCATORS, FORMATTERS, SCALES):
     for _key, _cls in _src.items():
         if isinstance(_cls, type):  # i.e. not a scale preset
             _globals[_cls.__name__] = _cls  # may overwrite proplot names
 
+
 # Register objects
 from .config import register_cmaps, register_cycles, register_colors, register_fonts
-with _benchmark('cmaps'):
-    register_cmaps(default=True)
-with _benchmark('cycles'):
-    register_cycles(default=True)
-with _benchmark('colors'):
-    register_colors(default=True)
-with _benchmark('fonts'):
-    register_fonts(default=True)
+with _benchmark('register'):
+    with _benchmark('cmaps'):
+        register_cmaps(default=True)
+    with _benchmark('cycles'):
+        register_cycles(default=True)
+    with _benchmark('colors'):
+        register_colors(default=True)
+    with _benchmark('fonts'):
+        register_fonts(default=True)
 
 # Validate colormap names and propagate 'cycle' to 'axes.prop_cycle'
 # NOTE: cmap.sequential also updates siblings 'cmap' and 'image.cmap'
 from .config import rc
 from .internals import rcsetup, warnings
 rcsetup.VALIDATE_REGISTERED_CMAPS = True
-for _key in ('cycle', 'cmap.sequential', 'cmap.diverging', 'cmap.cyclic', 'cmap.qualitative'):  # noqa: E501
-    try:
-        rc[_key] = rc[_key]
-    except ValueError as err:
-        warnings._warn_proplot(f'Invalid user rc file setting: {err}')
-        rc[_key] = 'Greys'  # fill value
+with _benchmark('validate'):
+    for _key in ('cycle', 'cmap.sequential', 'cmap.diverging', 'cmap.cyclic', 'cmap.qualitative'):  # noqa: E501
+        try:
+            rc[_key] = rc[_key]
+        except ValueError as err:
+            warnings._warn_proplot(f'Invalid user rc file setting: {err}')
+            rc[_key] = 'Greys'  # fill value
 
 # Validate color names now that colors are registered
 # NOTE: This updates all settings with 'color' in name (harmless if it's not a color)
 from .config import rc_proplot, rc_matplotlib
 rcsetup.VALIDATE_REGISTERED_COLORS = True
-for _src in (rc_proplot, rc_matplotlib):
-    for _key in _src:  # loop through unsynced properties
-        if 'color' not in _key:
-            continue
-        try:
-            _src[_key] = _src[_key]
-        except ValueError as err:
-            warnings._warn_proplot(f'Invalid user rc file setting: {err}')
-            _src[_key] = 'black'  # fill value
+with _benchmark('validate'):
+    for _src in (rc_proplot, rc_matplotlib):
+        for _key in _src:  # loop through unsynced properties
+            if 'color' not in _key:
+                continue
+            try:
+                _src[_key] = _src[_key]
+            except ValueError as err:
+                warnings._warn_proplot(f'Invalid user rc file setting: {err}')
+                _src[_key] = 'black'  # fill value
+
+
+# Lazily add cartopy projection classes to top-level namespace
+# NOTE: Cartopy is slow to import so this is deferred until a projection class
+# or the 'crs' module is requested. Module __getattr__ requires python >= 3.7 so
+# the classes are added eagerly on older versions. Since 'from proplot import *'
+# only exports existing globals, the classes are not exported on python >= 3.7.
+# NOTE: Only the registered class names trigger the import so that other lookups
+# (e.g. typos or hasattr() probes) never import cartopy.
+# NOTE: Use import_module because 'from . import proj' calls this function.
+def __getattr__(name):
+    import importlib
+    from .constructor import PROJS, PROJS_CARTOPY, PROJS_PROPLOT
+    from .internals import _has_module
+    if name in ('crs', 'proj'):  # 'crs' is for backwards compatibility
+        return importlib.import_module(__name__ + '.proj')
+    names = (*PROJS_PROPLOT.values(), *PROJS_CARTOPY.values())
+    if name in names and _has_module('cartopy'):
+        classes = {cls.__name__: cls for cls in PROJS.values()}
+        if name in classes:
+            return classes[name]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+if sys.version_info < (3, 7):
+    from . import proj as crs  # backwards compatibility  # noqa: F401
+    with _benchmark('proj'):
+        from .proj import *  # noqa: F401 F403
+    for _key, _cls in PROJS.items():
+        if isinstance(_cls, type):
+            _globals[_cls.__name__] = _cls
@@ -30,6 +30,8 @@ from .. import ticker as pticker
 from ..config import rc
 from ..internals import ic  # noqa: F401
 from ..internals import (
+    _has_module,
+    _is_instance,
     _kwargs_to_args,
     _not_none,
     _pop_kwargs,
@@ -46,11 +48,6 @@ from ..internals import (
 )
 from ..utils import _fontsize_to_pt, edges, units
 
-try:
-    from cartopy.crs import CRS, PlateCarree
-except Exception:
-    CRS = PlateCarree = object
-
 __all__ = ['Axes']
 
 
@@ -768,6 +765,7 @@ class Axes(maxes.Axes):
         self._abc_title_pad = rc['abc.titlepad']
         self._title_above = rc['title.above']
         self._title_border_kwargs = {}  # title border properties
+        self._title_kwargs = {}  # properties for titles not yet created
         self._title_loc = None
         self._title_pad = rc['title.pad']
         self._title_pad_current = None
@@ -790,7 +788,7 @@ class Axes(maxes.Axes):
         self.yaxis.isDefault_minloc = True
 
         # Various dictionary properties
-        # NOTE: Critical to use self.text() so they are patched with _update_label
+        # NOTE: The a-b-c label and inner titles are created on demand by _get_title
         self._legend_dict = {}
         self._colorbar_dict = {}
         d = self._panel_dict = {}
@@ -799,17 +797,9 @@ class Axes(maxes.Axes):
         d['bottom'] = []
         d['top'] = []
         d = self._title_dict = {}
-        kw = {'zorder': 3.5, 'transform': self.transAxes}
-        d['abc'] = self.text(0, 0, '', **kw)
         d['left'] = self._left_title  # WARNING: track in case mpl changes this
         d['center'] = self.title
         d['right'] = self._right_title
-        d['upper left'] = self.text(0, 0, '', va='top', ha='left', **kw)
-        d['upper center'] = self.text(0, 0.5, '', va='top', ha='center', **kw)
-        d['upper right'] = self.text(0, 1, '', va='top', ha='right', **kw)
-        d['lower left'] = self.text(0, 0, '', va='bottom', ha='left', **kw)
-        d['lower center'] = self.text(0, 0.5, '', va='bottom', ha='center', **kw)
-        d['lower right'] = self.text(0, 1, '', va='bottom', ha='right', **kw)
 
         # Subplot-specific settings
         # NOTE: Default number for any axes is None (i.e., no a-b-c labels allowed)
@@ -830,7 +820,10 @@ class Axes(maxes.Axes):
         # Default formatting
         # NOTE: This ignores user-input rc_mode. Mode '1' applies proplot
         # features which is necessary on first run. Default otherwise is mode '2'
-        self.format(rc_kw=rc_kw, rc_mode=1, skip_figure=True, **kw_format)
+        # NOTE: Settings looked up here are recorded by the first axes and reused
+        # for subsequent axes until rc changes. See Configurator._with_format_plan.
+        with rc._with_format_plan(not rc_kw and not kw_format):
+            self.format(rc_kw=rc_kw, rc_mode=1, skip_figure=True, **kw_format)
 
     def _add_inset_axes(
         self, bounds, transform=None, *, proj=None, projection=None,
@@ -1337,7 +1330,13 @@ class Axes(maxes.Axes):
         pax._title_pad = self._title_pad
         pax._abc_title_pad = self._abc_title_pad
         for name in names:
-            labels._transfer_label(self._title_dict[name], pax._title_dict[name])
+            src = self._title_dict.get(name)
+            if src is None:
+                continue
+            dest = pax._get_title(name, create=bool(src.get_text().strip()))
+            if dest is None:
+                continue
+            labels._transfer_label(src, dest)
 
     def _apply_auto_share(self):
         """
@@ -1497,6 +1496,30 @@ class Axes(maxes.Axes):
         height = height * abs(bbox.height)
         return np.array([width, height])
 
+    def _get_title(self, loc, create=False):
+        """
+        Return the title or a-b-c label at the specified location. The a-b-c label
+        and inner titles are created if `create` is ``True`` and otherwise ``None``.
+        """
+        # NOTE: Critical to use self.text() so they are patched with _update_label
+        obj = self._title_dict.get(loc)
+        if obj is None and create:
+            kw = {'zorder': 3.5, 'transform': self.transAxes}
+            if loc != 'abc':
+                kw['ha'], kw['va'] = self._get_title_align(loc)
+            obj = self._title_dict[loc] = self.text(0, 0, '', **kw)
+            obj.update(self._title_kwargs.pop(loc, {}))
+        return obj
+
+    @staticmethod
+    def _get_title_align(loc):
+        """
+        Return the horizontal and vertical alignment for the inner title location.
+        """
+        ha = loc.split()[-1]
+        va = 'top' if loc.startswith('upper') else 'bottom'
+        return ha, va
+
     def _get_topmost_axes(self):
         """
         Return the topmost axes including panels and parents.
@@ -1515,9 +1538,10 @@ class Axes(maxes.Axes):
         transform = _not_none(transform, default)
         if isinstance(transform, mtransforms.Transform):
             return transform
-        elif CRS is not object and isinstance(transform, CRS):
+        elif _is_instance(transform, 'cartopy.crs', 'CRS'):
             return transform
-        elif PlateCarree is not object and transform == 'map':
+        elif transform == 'map' and _has_module('cartopy'):
+            from cartopy.crs import PlateCarree
             return PlateCarree()
         elif transform == 'data':
             return self.transData
@@ -2248,7 +2272,7 @@ class Axes(maxes.Axes):
         if loc not in ('left', 'right', 'center'):
             kw.update(self._abc_border_kwargs)
         kw.update(kwargs)
-        self._title_dict['abc'].update(kw)
+        self._update_title_text('abc', kw)
 
     def _update_title(self, loc, title=None, **kwargs):
         """
@@ -2306,8 +2330,11 @@ class Axes(maxes.Axes):
             old = self._title_loc
             loc = rc.find('title.loc', context=True)
             loc = self._title_loc = _translate_loc(loc or self._title_loc, 'text')
-            if loc != old and old is not None:
-                labels._transfer_label(self._title_dict[old], self._title_dict[loc])
+            src = self._title_dict.get(old)
+            if loc != old and src is not None:
+                dest = self._get_title(loc, create=bool(src.get_text().strip()))
+                if dest is not None:
+                    labels._transfer_label(src, dest)
 
         # Update the title text. For outer panels, add text to the panel if
         # necesssary. For inner panels, use the border and bbox settings.
@@ -2330,7 +2357,18 @@ class Axes(maxes.Axes):
         else:
             raise ValueError(f'Invalid title {title!r}. Must be string(s).')
         kw.update(kwargs)
-        self._title_dict[loc].update(kw)
+        self._update_title_text(loc, kw)
+
+    def _update_title_text(self, loc, kw):
+        """
+        Update the title or a-b-c label at the specified location. Properties
+        are stored until the label is created with non-empty text.
+        """
+        obj = self._get_title(loc, create=bool(kw.get('text')))
+        if obj is None:
+            self._title_kwargs.setdefault(loc, {}).update(kw)
+        else:
+            obj.update(kw)
 
     def _update_title_position(self, renderer):
         """
@@ -2343,7 +2381,7 @@ class Axes(maxes.Axes):
         width, height = self._get_size_inches()
         x_pad = self._title_pad / (72 * width)
         y_pad = self._title_pad / (72 * height)
-        for loc, obj in self._title_dict.items():
+        for loc, obj in tuple(self._title_dict.items()):
             x, y = (0, 1)
             if loc == 'abc':  # redirect
                 loc = self._abc_loc
@@ -2388,8 +2426,18 @@ class Axes(maxes.Axes):
         super()._update_title_position(renderer)
 
         # Sync the title position with the a-b-c label position
-        aobj = self._title_dict['abc']
-        tobj = self._title_dict[self._abc_loc]
+        # NOTE: Inner titles are only created once they are used, so we apply
+        # the inner title alignment if there is no title in the a-b-c location.
+        aobj = self._title_dict.get('abc')
+        tobj = self._title_dict.get(self._abc_loc)
+        if aobj is None:
+            return
+        if tobj is None:
+            ha, va = self._get_title_align(self._abc_loc)
+            aobj.set_transform(self.transAxes)
+            aobj.set_ha(ha)
+            aobj.set_va(va)
+            return
         aobj.set_transform(tobj.get_transform())
         aobj.set_position(tobj.get_position())
         aobj.set_ha(tobj.get_ha())
@@ -2506,6 +2554,7 @@ class Axes(maxes.Axes):
         proplot.gridspec.SubplotGrid.format
         proplot.config.Configurator.context
         """
+        rc._check_generation()
         skip_figure = kwargs.pop('skip_figure', False)  # internal keyword arg
         params = _pop_params(kwargs, self.figure._format_signature)
 
@@ -12,26 +12,25 @@ import matplotlib.ticker as mticker
 import numpy as np
 
 from .. import constructor
-from .. import proj as pproj
 from ..config import rc
 from ..internals import ic  # noqa: F401
-from ..internals import _not_none, _pop_rc, _version_cartopy, docstring, warnings
+from ..internals import (
+    _is_instance,
+    _not_none,
+    _pop_rc,
+    _version_cartopy,
+    caches,
+    docstring,
+    versions,
+    warnings,
+)
+from ..internals.benchmarks import _benchmark
 from . import plot
 
-try:
-    import cartopy.crs as ccrs
-    import cartopy.feature as cfeature
-    import cartopy.mpl.gridliner as cgridliner
-    from cartopy.crs import Projection
-    from cartopy.mpl.geoaxes import GeoAxes as _GeoAxes
-except ModuleNotFoundError:
-    ccrs = cfeature = cgridliner = None
-    _GeoAxes = Projection = object
-
-try:
-    from mpl_toolkits.basemap import Basemap
-except ModuleNotFoundError:
-    Basemap = object
+# Cartopy modules imported by _load_cartopy() when a cartopy axes is created
+# NOTE: Cartopy and basemap are slow to import so we defer the imports until
+# a geographic axes is requested rather than importing them with proplot.
+ccrs = cfeature = cgridliner = pproj = None
 
 __all__ = ['GeoAxes']
 
@@ -190,10 +189,86 @@ class _GeoLabel(object):
             return False
 
 
-# Add monkey patch to gridliner module
-if cgridliner is not None and hasattr(cgridliner, 'Label'):  # only recent versions
-    _cls = type('Label', (_GeoLabel, cgridliner.Label), {})
-    cgridliner.Label = _cls
+def _load_cartopy():
+    """
+    Import the cartopy modules and add the monkey patch to the gridliner module.
+    """
+    global ccrs, cfeature, cgridliner, pproj
+    if ccrs is not None:
+        return
+    import cartopy.crs as ccrs
+    import cartopy.feature as cfeature
+    import cartopy.mpl.gridliner as cgridliner
+
+    from .. import proj as pproj
+    if hasattr(cgridliner, 'Label'):  # only recent versions
+        cgridliner.Label = type('Label', (_GeoLabel, cgridliner.Label), {})
+
+
+class _ProjectedFeature(versions._DeferredBases):
+    """
+    Cartopy feature with geometries projected to the map projection. The source
+    geometries and projected geometries are shared between axes with identical
+    features and projections using the cache ``'features'``.
+    """
+    # NOTE: Cartopy caches the paths for each geometry and projection but still tests
+    # every geometry against the extent with shapely on each draw. Here the source
+    # geometry bounds are tested all at once and the geometries are projected only
+    # when they first enter the extent. Since the same projected geometry objects
+    # are returned for every extent, cartopy's path cache is also used when panning
+    # and zooming. Geometries are not clipped since the axes patch clips the paths.
+    @classmethod
+    def _load_bases(cls):
+        _load_cartopy()
+        return (cfeature.Feature,), {}
+
+    def __init__(self, feature, axes):
+        super().__init__(axes.projection, **feature.kwargs)
+        self._feature = feature
+        self._axes = axes
+
+    def geometries(self):
+        return self.intersecting_geometries(None)
+
+    def intersecting_geometries(self, extent):
+        feature = self._feature
+        cache = caches._get_cache('features')
+        cache.maxsize = rc['geo.featurecache']
+        key = tuple(
+            getattr(feature, attr, None) for attr in ('category', 'name', 'scale')
+        )
+        source = cache.get(key)
+        if source is None:
+            geoms = tuple(
+                geom for geom in feature.geometries()
+                if geom is not None and not geom.is_empty
+            )
+            bounds = np.array([geom.bounds for geom in geoms], dtype=float)
+            source = (geoms, bounds.reshape(-1, 4))
+            cache.set(key, source)
+        projected = cache.get(key + (self.crs,))
+        if projected is None:
+            projected = {}
+            cache.set(key + (self.crs,), projected)
+        geoms, bounds = source
+        if extent is None or np.isnan(extent[0]):  # empty extent
+            index = range(len(geoms))
+        else:
+            x0, x1, y0, y1 = self._axes.get_extent(feature.crs)
+            index, = np.nonzero(
+                (bounds[:, 0] <= x1) & (bounds[:, 2] >= x0)
+                & (bounds[:, 1] <= y1) & (bounds[:, 3] >= y0)
+            )
+        project = self.crs != feature.crs
+        for idx in index:
+            geom = projected.get(idx)
+            if geom is None:
+                geom = geoms[idx]
+                if project:
+                    geom = self.crs.project_geometry(geom, feature.crs)
+                projected[idx] = geom
+            if not geom.is_empty:
+                yield geom
 
 
 class _GeoAxis(object):
@@ -750,32 +825,45 @@ class GeoAxes(plot.PlotAxes):
 
     @projection.setter
     def projection(self, map_projection):
-        cls = self._proj_class
-        if not isinstance(map_projection, cls):
-            raise ValueError(f'Projection must be a {cls} instance.')
+        module, name = self._proj_class
+        if not _is_instance(map_projection, module, name):
+            raise ValueError(f'Projection must be a {module}.{name} instance.')
         self._map_projection = map_projection
 
 
-class _CartopyAxes(GeoAxes, _GeoAxes):
+class _CartopyAxes(versions._DeferredBases, GeoAxes):
     """
     Axes subclass for plotting cartopy projections.
     """
+    # NOTE: The cartopy GeoAxes base class and the polar projection classes
+    # are added by _load_bases() on first instantiation. See _DeferredBases.
     _name = 'cartopy'
     _name_aliases = ('geo', 'geographic')  # default 'geographic' axes
-    _proj_class = Projection
-    _proj_north = (
-        pproj.NorthPolarStereo,
-        pproj.NorthPolarGnomonic,
-        pproj.NorthPolarAzimuthalEquidistant,
-        pproj.NorthPolarLambertAzimuthalEqualArea,
-    )
-    _proj_south = (
-        pproj.SouthPolarStereo,
-        pproj.SouthPolarGnomonic,
-        pproj.SouthPolarAzimuthalEquidistant,
-        pproj.SouthPolarLambertAzimuthalEqualArea
-    )
-    _proj_polar = _proj_north + _proj_south
+    _proj_class = ('cartopy.crs', 'Projection')
+    _proj_north = _proj_south = _proj_polar = ()
+
+    @classmethod
+    def _load_bases(cls):
+        _load_cartopy()
+        from cartopy.mpl.geoaxes import GeoAxes as _GeoAxes
+        north = (
+            pproj.NorthPolarStereo,
+            pproj.NorthPolarGnomonic,
+            pproj.NorthPolarAzimuthalEquidistant,
+            pproj.NorthPolarLambertAzimuthalEqualArea,
+        )
+        south = (
+            pproj.SouthPolarStereo,
+            pproj.SouthPolarGnomonic,
+            pproj.SouthPolarAzimuthalEquidistant,
+            pproj.SouthPolarLambertAzimuthalEqualArea
+        )
+        attrs = {
+            '_proj_north': north,
+            '_proj_south': south,
+            '_proj_polar': north + south,
+        }
+        return (_GeoAxes,), attrs
 
     # NOTE: The rename argument wrapper belongs here instead of format() because
     # these arguments were previously only accepted during initialization.
@@ -824,6 +912,24 @@ class _CartopyAxes(GeoAxes, _GeoAxes):
         verts = np.vstack([np.sin(theta), np.cos(theta)]).T
         return mpath.Path(verts * radius + center)
 
+    @staticmethod
+    def _get_gridliner_key(gl, renderer=None):
+        """
+        Return the settings and axes state used to draw gridlines and labels.
+        """
+        if _version_cartopy < '0.18':  # redrawn every time
+            return None
+        ax = gl.axes
+        state = {
+            key: dict(value) if isinstance(value, dict)
+            else list(value) if isinstance(value, list)
+            else value
+            for key, value in vars(gl).items()
+            if key[:1] != '_' and key != 'axes' and not key.endswith('_artists')
+        }
+        bounds = tuple(round(x / ax.figure.dpi, 3) for x in ax.bbox.bounds)  # inches
+        return (ax.projection, ax.viewLim.bounds, bounds, type(renderer), state)
+
     def _get_global_extent(self):
         """
         Return the global extent with meridian properly shifted.
@@ -850,8 +956,18 @@ class _CartopyAxes(GeoAxes, _GeoAxes):
             return x_range, y_range
         # Cartopy >= 0.18 monkey patch. Fixes issue where cartopy draws an overlapping
         # dateline gridline (e.g. polar maps). See the nx -= 1 line in _draw_gridliner
+        # NOTE: Also skip drawing if the gridliner settings, locators, and axes extent
+        # and position are unchanged since the last call. This is called for every
+        # get_tightbbox() during the layout passes and again when the axes is drawn.
+        # Recent cartopy versions only draw once unless auto_update is passed.
         def _draw_gridliner(self, *args, **kwargs):  # noqa: E306
-            result = type(self)._draw_gridliner(self, *args, **kwargs)
+            key = _CartopyAxes._get_gridliner_key(self, kwargs.get('renderer'))
+            if key is not None and key == getattr(self, '_proplot_key', None):
+                return
+            self._proplot_key = key
+            self._drawn = False  # cartopy >= 0.21
+            with _benchmark('gridliner'):  # record the number of updates
+                result = type(self)._draw_gridliner(self, *args, **kwargs)
             if _version_cartopy >= '0.18':
                 lon_lim, _ = self._axes_domain()
                 if abs(np.diff(lon_lim)) == abs(np.diff(self.crs.x_limits)):
@@ -1045,6 +1161,8 @@ class _CartopyAxes(GeoAxes, _GeoAxes):
                 else:
                     if not drawn:
                         feat = cfeature.NaturalEarthFeature(*args, reso)
+                        if rc['geo.featurecache'] > 0:
+                            feat = _ProjectedFeature(feat, self)
                         feat = self.add_feature(feat)  # convert to FeatureArtist
 
             # Update artist attributes (FeatureArtist._kwargs used back to v0.5).
@@ -1192,7 +1310,10 @@ class _CartopyAxes(GeoAxes, _GeoAxes):
                 extent[:2] = [lon0 - 180, lon0 + 180]
         return extent
 
-    def get_tightbbox(self, renderer, *args, **kwargs):
+    def _draw_gridliners(self, renderer):
+        """
+        Adjust the axes and draw the gridliners.
+        """
         # Perform extra post-processing steps
         # For now this just draws the gridliners
         self._apply_axis_sharing()
@@ -1222,6 +1343,15 @@ class _CartopyAxes(GeoAxes, _GeoAxes):
         if _version_cartopy < '0.18':
             self._gridliners = []
 
+    def get_default_bbox_extra_artists(self):
+        # Draw the gridliners before Figure.get_tightbbox() collects the label
+        # artists. Otherwise labels removed by get_tightbbox() are still included.
+        if _version_cartopy >= '0.18':
+            self._draw_gridliners(self.figure._get_renderer())
+        return super().get_default_bbox_extra_artists()
+
+    def get_tightbbox(self, renderer, *args, **kwargs):
+        self._draw_gridliners(renderer)
         return super().get_tightbbox(renderer, *args, **kwargs)
 
     def set_extent(self, extent, crs=None):
@@ -1262,7 +1392,7 @@ class _BasemapAxes(GeoAxes):
     Axes subclass for plotting basemap projections.
     """
     _name = 'basemap'
-    _proj_class = Basemap
+    _proj_class = ('mpl_toolkits.basemap', 'Basemap')
     _proj_north = ('npaeqd', 'nplaea', 'npstere')
     _proj_south = ('spaeqd', 'splaea', 'spstere')
     _proj_polar = _proj_north + _proj_south
@@ -30,10 +30,12 @@ from ..config import rc
 from ..internals import ic  # noqa: F401
 from ..internals import (
     _get_aliases,
+    _is_instance,
     _not_none,
     _pop_kwargs,
     _pop_params,
     _pop_props,
+    caches,
     context,
     docstring,
     guides,
@@ -42,11 +44,6 @@ from ..internals import (
 )
 from . import base
 
-try:
-    from cartopy.crs import PlateCarree
-except ModuleNotFoundError:
-    PlateCarree = object
-
 __all__ = ['PlotAxes']
 
 
@@ -364,7 +361,8 @@ robust : bool, float, or 2-tuple, default: :rc:`cmap.robust`
     minimum and maximum. If float, this percentile range is used (for example,
     ``90`` corresponds to the 5th to 95th percentiles). If 2-tuple of float,
     these specific percentiles should be used. This feature is useful
-    when your data has large outliers.
+    when your data has large outliers. See :rcraw:`cmap.robust_sample`
+    for estimating the percentiles of very large arrays.
 inbounds : bool, default: :rc:`cmap.inbounds`
     If ``True`` and `vmin` or `vmax` were not provided, when axis limits
     have been explicitly restricted with `~matplotlib.axes.Axes.set_xlim`
@@ -394,6 +392,21 @@ docstring._snippet_manager['plot.levels_manual'] = _manual_levels_docstring
 docstring._snippet_manager['plot.levels_auto'] = _auto_levels_docstring
 
 
+# Downsampling docstring
+_downsample_docstring = """
+downsample : bool or {'mean', 'max', 'nearest'}, default: :rc:`plot.downsample`
+    Whether to reduce data with more values than display pixels in each dimension
+    (given the axes size and the figure dpi) by replacing blocks of values that
+    fall in the same pixel with their average (``True`` or ``'mean'``), their
+    maximum (``'max'``), or their central value (``'nearest'``). The colormap
+    normalization is still determined from the full-resolution data. This can
+    considerably reduce render times and the size of vector graphics files. For
+    dask arrays the blocks are reduced before the arrays are computed, and integer
+    or boolean data is always sampled with ``'nearest'``.
+"""
+docstring._snippet_manager['plot.downsample'] = _downsample_docstring
+
+
 # Labels docstrings
 _label_docstring = """
 label, value : float or str, optional
@@ -475,6 +488,13 @@ Other parameters
 %(plot.inbounds)s
 %(plot.labels_1d)s
 %(plot.guide)s
+decimate : bool, default: :rc:`plot.decimate`
+    Whether to draw long lines using only the first, last, minimum, and maximum
+    points within each pixel along the `{x}` axis for the current axis limits.
+    This has almost no visual effect and can considerably reduce render times and
+    the size of vector graphics files. Lines are decimated again whenever they are
+    drawn, so this works with changing axis limits. Requires ascending `{x}`
+    coordinates and has no effect on non-cartesian axes.
 **kwargs
     Passed to `~matplotlib.axes.Axes.plot`.
 
@@ -484,8 +504,8 @@ PlotAxes.plot
 PlotAxes.plotx
 matplotlib.axes.Axes.plot
 """
-docstring._snippet_manager['plot.plot'] = _plot_docstring.format(y='y')
-docstring._snippet_manager['plot.plotx'] = _plot_docstring.format(y='x')
+docstring._snippet_manager['plot.plot'] = _plot_docstring.format(y='y', x='x')
+docstring._snippet_manager['plot.plotx'] = _plot_docstring.format(y='x', x='y')
 
 
 # Step docstring
@@ -596,6 +616,12 @@ interp : int, default: 0
     Interpolate to this many additional points between the parametric
     coordinates. This can be increased to make the color gradations
     between a small number of coordinates appear "smooth".
+decimate : bool or float, default: False
+    Whether to drop consecutive coordinates that fall within the same display
+    pixel before creating the line segments. This can considerably speed up
+    drawing very long trajectories. If float, this is the size of the "pixels"
+    used for decimation (e.g. ``decimate=2`` drops coordinates that fall within
+    the same 2 by 2 pixel square). Decimation is applied before interpolation.
 %(plot.args_1d_shared)s
 
 Other parameters
@@ -1028,7 +1054,7 @@ Other parameters
 %(plot.levels_auto)s
 %(artist.collection_contour)s{edgefix}
 %(plot.labels_2d)s
-%(plot.guide)s
+%(plot.guide)s{downsample}
 **kwargs
     Passed to `matplotlib.axes.Axes.{command}`.
 
@@ -1041,16 +1067,20 @@ PlotAxes.tricontourf
 matplotlib.axes.Axes.{command}
 """
 docstring._snippet_manager['plot.contour'] = _contour_docstring.format(
-    descrip='contour lines', command='contour', edgefix=''
+    descrip='contour lines', command='contour', edgefix='',
+    downsample='\n%(plot.downsample)s',
 )
 docstring._snippet_manager['plot.contourf'] = _contour_docstring.format(
     descrip='filled contours', command='contourf', edgefix='%(axes.edgefix)s\n',
+    downsample='\n%(plot.downsample)s',
 )
 docstring._snippet_manager['plot.tricontour'] = _contour_docstring.format(
-    descrip='contour lines on a triangular grid', command='tricontour', edgefix=''
+    descrip='contour lines on a triangular grid', command='tricontour', edgefix='',
+    downsample='',
 )
 docstring._snippet_manager['plot.tricontourf'] = _contour_docstring.format(
-    descrip='filled contours on a triangular grid', command='tricontourf', edgefix='\n%(axes.edgefix)s'  # noqa: E501
+    descrip='filled contours on a triangular grid', command='tricontourf', edgefix='\n%(axes.edgefix)s',  # noqa: E501
+    downsample='',
 )
 
 
@@ -1073,7 +1103,7 @@ Other parameters
 %(artist.collection_pcolor)s
 %(axes.edgefix)s
 %(plot.labels_2d)s
-%(plot.guide)s
+%(plot.guide)s{downsample}
 **kwargs
     Passed to `matplotlib.axes.Axes.{command}`.
 
@@ -1103,19 +1133,23 @@ aspect : {'equal', 'auto'} or float, default: :rc:`image.aspet`
       the layout. In general this results in non-square grid boxes.
 """.rstrip()
 docstring._snippet_manager['plot.pcolor'] = _pcolor_docstring.format(
-    descrip='irregular grid boxes', command='pcolor', aspect=''
+    descrip='irregular grid boxes', command='pcolor', aspect='',
+    downsample='\n%(plot.downsample)s',
 )
 docstring._snippet_manager['plot.pcolormesh'] = _pcolor_docstring.format(
-    descrip='regular grid boxes', command='pcolormesh', aspect=''
+    descrip='regular grid boxes', command='pcolormesh', aspect='',
+    downsample='\n%(plot.downsample)s',
 )
 docstring._snippet_manager['plot.pcolorfast'] = _pcolor_docstring.format(
-    descrip='grid boxes quickly', command='pcolorfast', aspect=''
+    descrip='grid boxes quickly', command='pcolorfast', aspect='',
+    downsample='\n%(plot.downsample)s',
 )
 docstring._snippet_manager['plot.tripcolor'] = _pcolor_docstring.format(
-    descrip='triangular grid boxes', command='tripcolor', aspect=''
+    descrip='triangular grid boxes', command='tripcolor', aspect='', downsample=''
 )
 docstring._snippet_manager['plot.heatmap'] = _pcolor_docstring.format(
-    descrip=_heatmap_descrip, command='pcolormesh', aspect=_heatmap_aspect
+    descrip=_heatmap_descrip, command='pcolormesh', aspect=_heatmap_aspect,
+    downsample='\n%(plot.downsample)s',
 )
 
 
@@ -1135,7 +1169,7 @@ Other parameters
 %(plot.vmin_vmax)s
 %(plot.levels_manual)s
 %(plot.levels_auto)s
-%(plot.guide)s
+%(plot.guide)s{downsample}
 **kwargs
     Passed to `matplotlib.axes.Axes.{command}`.
 
@@ -1145,13 +1179,13 @@ proplot.axes.PlotAxes
 matplotlib.axes.Axes.{command}
 """
 docstring._snippet_manager['plot.imshow'] = _show_docstring.format(
-    descrip='an image', command='imshow'
+    descrip='an image', command='imshow', downsample='\n%(plot.downsample)s'
 )
 docstring._snippet_manager['plot.matshow'] = _show_docstring.format(
-    descrip='a matrix', command='matshow'
+    descrip='a matrix', command='matshow', downsample='\n%(plot.downsample)s'
 )
 docstring._snippet_manager['plot.spy'] = _show_docstring.format(
-    descrip='a sparcity pattern', command='spy'
+    descrip='a sparcity pattern', command='spy', downsample=''
 )
 
 
@@ -1733,6 +1767,74 @@ class PlotAxes(base.Axes):
             if b is not None:
                 self.grid(b, axis=axis, which=which)
 
+    @contextlib.contextmanager
+    def _decimate_lines(self):
+        """
+        Temporarily replace the data of long lines plotted with ``decimate=True``
+        with the points needed to draw them at the current limits and resolution.
+        """
+        # NOTE: This runs at draw time so lines are decimated again whenever the
+        # axis limits or the axes size change, and the line data is unchanged
+        # outside of draws. Indices are cached for unchanged views and data. The data
+        # are compared by content since e.g. 'y[:] = new; line.set_ydata(y)' keeps
+        # the array identities and matplotlib < 3.6 does not copy the arrays.
+        lines = []
+        for line in self.lines if self._name == 'cartesian' else ():
+            axis = getattr(line, '_decimate_axis', None)
+            if axis is None or not line.get_visible():
+                continue
+            if line.get_transform() is not self.transData:
+                continue
+            x0, width = (self.bbox.x0, self.bbox.width) if axis == 'x' else (self.bbox.y0, self.bbox.height)  # noqa: E501
+            offset = round(x0 % 1, 6)  # align bins with display pixels
+            data = line.get_data(orig=True)
+            size = np.size(data[0])
+            if size <= 4 * (width + 2):
+                continue
+            ids = tuple(map(caches._array_key, data))
+            ids = None if None in ids else ids  # unsupported data
+            lim = tuple(sorted(getattr(self, f'get_{axis}lim')()))
+            key = (*(ids or (None, None)), lim, width, offset)
+            cache = getattr(line, '_decimate_cache', None) or ((), None, None)
+            if ids is not None and cache[0] == key:
+                index = cache[1]
+            else:
+                # NOTE: Convert units ourselves instead of using get_xdata(orig=False)
+                # since that caches the full-resolution path on every draw.
+                xs = [
+                    np.ma.filled(np.ma.asarray(convert(d), dtype=float), np.nan).ravel()
+                    for convert, d in zip(
+                        (line.convert_xunits, line.convert_yunits), data
+                    )
+                ]
+                x, y = xs if axis == 'x' else xs[::-1]
+                ascending = cache[2] if ids and cache[0][:2] == ids else None
+                if ascending is None:
+                    ascending = bool(np.all(x[1:] >= x[:-1]))
+                index = None
+                if ascending:
+                    transform = getattr(self, axis + 'axis').get_transform()
+                    lo, hi = transform.transform(np.array(lim))
+                    index = inputs._decimate_index(
+                        transform.transform(x), y, lo, hi, width, offset
+                    )
+                line._decimate_cache = (key, index, ascending)
+            if index is None or index.size == size:
+                continue
+            try:
+                line.set_data(*(d[index] for d in data))
+            except (TypeError, IndexError):  # e.g. non-array input
+                continue
+            lines.append((line, data))
+        try:
+            yield
+        finally:
+            for line, data in lines:
+                line.set_data(*data)
+                line.stale = False
+            if lines:
+                self.stale = False
+
     def _inbounds_extent(self, *, inbounds=None, **kwargs):
         """
         Capture the `inbounds` keyword arg and return data limit
@@ -1854,7 +1956,7 @@ class PlotAxes(base.Axes):
         x, *ys, kwargs = self._parse_1d_format(x, *ys, zerox=zerox, **kwargs)
 
         # Geographic corrections
-        if self._name == 'cartopy' and isinstance(kwargs.get('transform'), PlateCarree):  # noqa: E501
+        if self._name == 'cartopy' and _is_instance(kwargs.get('transform'), 'cartopy.crs', 'PlateCarree'):  # noqa: E501
             x, *ys = inputs._geo_cartopy_1d(x, *ys)
         elif self._name == 'basemap' and kwargs.get('latlon', None):
             xmin, xmax = self._lonaxis.get_view_interval()
@@ -1996,6 +2098,26 @@ class PlotAxes(base.Axes):
                 x = x.T
             if y is not None:
                 y = y.T
+
+        # Compute dask arrays and optionally coarsen them to the axes resolution
+        # NOTE: This computes the full-resolution range with chunked reductions
+        # and caches it for the automatic colormap normalization range. Arrays are
+        # only coarsened before computing if downsampling was requested.
+        ranges, sources = [None] * len(zs), list(zs)
+        if any(map(inputs._is_dask, zs)):
+            zs, (x0, y0) = list(zs), (x, y)
+            downsample = _not_none(kwargs.get('downsample'), rc['plot.downsample'])
+            downsample = 'mean' if downsample is True else downsample
+            shape = (np.inf, np.inf)
+            if downsample and all(map(inputs._is_dask, zs)):
+                dpi = self.figure.dpi
+                width, height = self._get_size_inches()
+                shape = (height * dpi, width * dpi)
+            for i, z in enumerate(zs):
+                if inputs._is_dask(z):
+                    x, y, zs[i], ranges[i] = inputs._dask_coarsen(
+                        x0, y0, z, shape, method=downsample
+                    )
         x, y, *zs, kwargs = self._parse_2d_format(x, y, *zs, **kwargs)
         if edges:
             # NOTE: These functions quitely pass through 1D inputs, e.g. barb data
@@ -2006,12 +2128,16 @@ class PlotAxes(base.Axes):
         # Geographic corrections
         if allow1d:
             pass
-        elif self._name == 'cartopy' and isinstance(kwargs.get('transform'), PlateCarree):  # noqa: E501
+        elif self._name == 'cartopy' and _is_instance(kwargs.get('transform'), 'cartopy.crs', 'PlateCarree'):  # noqa: E501
             x, y, *zs = inputs._geo_cartopy_2d(x, y, *zs, globe=globe)
         elif self._name == 'basemap' and kwargs.get('latlon', None):
             xmin, xmax = self._lonaxis.get_view_interval()
             x, y, *zs = inputs._geo_basemap_2d(x, y, *zs, xmin=xmin, xmax=xmax, globe=globe)  # noqa: E501
-            x, y = np.meshgrid(x, y)  # WARNING: required always
+
+        # Cache the full-resolution ranges for the final data arrays
+        for z, range_, source in zip(zs, ranges, sources):
+            if range_ is not None:
+                inputs._cache_range(z, range_, source)
 
         return (x, y, *zs, kwargs)
 
@@ -2071,6 +2197,38 @@ class PlotAxes(base.Axes):
         zs = tuple(map(inputs._to_numpy_array, zs))
         return (x, y, *zs, kwargs)
 
+    def _parse_downsample(self, x, y, z, *, downsample=None):
+        """
+        Reduce 2D data with more values than display pixels. This should be
+        called after the colormap normalization has been determined.
+        """
+        # NOTE: Coordinates are sampled at the block centers or block edges. Skip
+        # if the coordinates are not grid centers or edges (e.g. barb data).
+        downsample = _not_none(downsample, rc['plot.downsample'])
+        downsample = 'mean' if downsample is True else downsample
+        if not downsample or np.ndim(z) < 2:
+            return x, y, z
+        if downsample not in ('mean', 'max', 'nearest'):
+            raise ValueError(
+                f'Invalid downsample={downsample!r}. Options are '
+                "True, False, 'mean', 'max', or 'nearest'."
+            )
+        z = inputs._to_numpy_array(z)
+        dpi = self.figure.dpi
+        width, height = self._get_size_inches()
+        steps = inputs._coarsen_steps(z.shape, (height * dpi, width * dpi))
+        if all(step == 1 for step in steps):
+            return x, y, z
+        xy = inputs._coarsen_coords(x, y, z.shape, steps)
+        if xy is None:
+            warnings._warn_proplot(
+                f'Ignoring downsample={downsample!r}. Coordinates must '
+                'be the centers or edges of the data grid boxes.'
+            )
+            return x, y, z
+        z = inputs._coarsen_data(z, steps, downsample)
+        return (*xy, z)
+
     def _parse_color(self, x, y, c, *, apply_cycle=True, infer_rgb=False, **kwargs):
         """
         Parse either a colormap or color cycler. Colormap will be discrete and fade
@@ -2381,6 +2539,7 @@ class PlotAxes(base.Axes):
 
         # Parse input args
         inbounds = _not_none(inbounds, rc['cmap.inbounds'])
+        sample = rc['cmap.robust_sample']
         robust = _not_none(robust, rc['cmap.robust'], False)
         robust = 96 if robust is True else 100 if robust is False else robust
         robust = np.atleast_1d(robust)
@@ -2396,10 +2555,15 @@ class PlotAxes(base.Axes):
         # commands are unstandardized.
         # NOTE: Try to get reasonable *count* levels for hexbin/hist2d, but in general
         # have no way to select nice ones a priori (why we disable discretenorm).
-        # NOTE: Currently we only ever use this function with *single* array input
-        # but in future could make this public as a way for users (me) to get
-        # automatic synced contours for a bunch of arrays in a grid.
+        # NOTE: Plotting commands use this function with *single* array input but
+        # SubplotGrid.levels passes multiple arrays to get synced levels for a grid.
+        # NOTE: The optional cache is keyed by the sample data contents after
+        # restricting to in-bounds data, so axis limits are accounted for. It is
+        # only used for percentile ranges since computing the key costs about as
+        # much as computing the minimum and maximum.
         vmins, vmaxs = [], []
+        cache = caches._get_cache('levels')
+        cache.maxsize = rc['cmap.levelcache']
         if len(args) > 2:
             x, y, *zs = args
         else:
@@ -2412,7 +2576,15 @@ class PlotAxes(base.Axes):
             z = inputs._to_numpy_array(z)
             if inbounds and x is not None and y is not None:  # ignore if None coords
                 z = self._inbounds_vlim(x, y, z, to_centers=to_centers)
-            imin, imax = inputs._safe_range(z, pmin, pmax)
+            percentile = pmin > 0 or pmax < 100
+            key = percentile and cache.maxsize > 0 and caches._array_key(z)
+            key = key and (key, float(pmin), float(pmax), sample)
+            range_ = cache.get(key) if key else None
+            if range_ is None:
+                range_ = inputs._safe_range(z, pmin, pmax, sample=sample)
+                if key:
+                    cache.set(key, range_)
+            imin, imax = range_
             if automin and imin is not None:
                 vmins.append(imin)
             if automax and imax is not None:
@@ -2820,11 +2992,12 @@ class PlotAxes(base.Axes):
 
         return norm, cmap, kwargs
 
-    def _apply_plot(self, *pairs, vert=True, **kwargs):
+    def _apply_plot(self, *pairs, vert=True, decimate=None, **kwargs):
         """
         Plot standard lines.
         """
         # Plot the lines
+        decimate = _not_none(decimate, rc['plot.decimate'])
         objs, xsides = [], []
         kws = kwargs.copy()
         kws.update(_pop_props(kws, 'line'))
@@ -2844,6 +3017,8 @@ class PlotAxes(base.Axes):
                 if fmt is not None:  # x1, y1, fmt1, x2, y2, fm2... style input
                     a.append(fmt)
                 obj, = self._call_native('plot', *a, **kw)
+                if decimate:
+                    obj._decimate_axis = 'x' if vert else 'y'
                 self._inbounds_xylim(extents, x, y)
                 objs.append((*eb, *es, obj) if eb or es else obj)
 
@@ -3001,9 +3176,31 @@ class PlotAxes(base.Axes):
         kwargs = _parse_vert(default_orientation='horizontal', **kwargs)
         return self._apply_stem(*args, **kwargs)
 
+    def _decimate_parametric(self, x, y, c, *, pixels=1):
+        """
+        Drop consecutive parametric coordinates within the same display pixel.
+        """
+        # NOTE: Pixel sizes are estimated from the data range and the axes size
+        # in scaled coordinates since the view limits are not yet known. Points
+        # with non-finite scaled coordinates are always kept (nan != nan).
+        if x.size < 3:
+            return x, y, c
+        xy = self.transScale.transform(np.column_stack((x, y)))
+        size = np.array([self.bbox.width, self.bbox.height]) / pixels
+        with np.errstate(all='ignore'):
+            xmin, xmax = np.nanmin(xy, axis=0), np.nanmax(xy, axis=0)
+            span = np.where(xmax > xmin, xmax - xmin, 1)
+            cells = np.floor((xy - xmin) / span * size)
+        keep = np.ones(xy.shape[0], dtype=bool)
+        keep[1:-1] = np.any(cells[1:-1] != cells[:-2], axis=1)
+        c = np.asarray(c)
+        return x[keep], y[keep], c[keep]
+
     @inputs._preprocess_or_redirect('x', 'y', ('c', 'color', 'colors', 'values'))
     @docstring._snippet_manager
-    def parametric(self, x, y, c, *, interp=0, scalex=True, scaley=True, **kwargs):
+    def parametric(
+        self, x, y, c, *, interp=0, decimate=False, scalex=True, scaley=True, **kwargs
+    ):
         """
         %(plot.parametric)s
         """
@@ -3039,32 +3236,34 @@ class PlotAxes(base.Axes):
         else:
             guides._add_guide_kw('colorbar', kw, locator=c)
 
+        # Drop coordinates within the same display pixel
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        if decimate:
+            pixels = 1 if decimate is True else decimate
+            x, y, c = self._decimate_parametric(x, y, c, pixels=pixels)
+
         # Interpolate values to allow for smooth gradations between values or just
         # to color siwtchover halfway between points (interp True, False respectively)
-        if interp > 0:
-            x_orig, y_orig, v_orig = x, y, c
-            x, y, c = [], [], []
-            for j in range(x_orig.shape[0] - 1):
-                idx = slice(None)
-                if j + 1 < x_orig.shape[0] - 1:
-                    idx = slice(None, -1)
-                x.extend(np.linspace(x_orig[j], x_orig[j + 1], interp + 2)[idx].flat)
-                y.extend(np.linspace(y_orig[j], y_orig[j + 1], interp + 2)[idx].flat)
-                c.extend(np.linspace(v_orig[j], v_orig[j + 1], interp + 2)[idx].flat)
-            x, y, c = np.array(x), np.array(y), np.array(c)
+        # NOTE: This omits the final point of all but the last segment to avoid
+        # repeating the shared endpoints, identical to concatenating np.linspace().
+        if interp > 0 and y.size > 1:
+            t = np.arange(interp + 1) / (interp + 1)
+            x, y, c = (
+                np.append((a[:-1, None] + np.diff(a)[:, None] * t).flat, a[-1:])
+                for a in (x, y, np.asarray(c, dtype=float))
+            )
 
         # Get coordinates and values for points to the 'left' and 'right' of joints
-        coords = []
-        for i in range(y.shape[0]):
-            icoords = np.empty((3, 2))
-            for j, arr in enumerate((x, y)):
-                icoords[:, j] = (
-                    arr[0] if i == 0 else 0.5 * (arr[i - 1] + arr[i]),
-                    arr[i],
-                    arr[-1] if i + 1 == y.shape[0] else 0.5 * (arr[i + 1] + arr[i]),
-                )
-            coords.append(icoords)
-        coords = np.array(coords)
+        # NOTE: This builds the (N, 3, 2) array of segment vertices at once rather
+        # than allocating one (3, 2) array per point.
+        xy = np.column_stack((x, y))
+        mid = 0.5 * (xy[:-1] + xy[1:])
+        coords = np.empty((xy.shape[0], 3, 2))
+        coords[:, 1] = xy
+        coords[:1, 0] = xy[:1]
+        coords[1:, 0] = mid
+        coords[:-1, 2] = mid
+        coords[-1:, 2] = xy[-1:]
 
         # Get the colormap accounting for 'discrete' mode
         discrete = kw.get('discrete', None)
@@ -3841,6 +4040,8 @@ class PlotAxes(base.Axes):
         kw = self._parse_cmap(
             x, y, z, min_levels=1, plot_lines=True, plot_contours=True, **kw
         )
+        downsample_kw = _pop_params(kw, self._parse_downsample)
+        x, y, z = self._parse_downsample(x, y, z, **downsample_kw)
         labels_kw = _pop_params(kw, self._add_auto_labels)
         guide_kw = _pop_params(kw, self._update_guide)
         label = kw.pop('label', None)
@@ -3860,6 +4061,8 @@ class PlotAxes(base.Axes):
         x, y, z, kw = self._parse_2d_args(x, y, z, **kwargs)
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(x, y, z, plot_contours=True, **kw)
+        downsample_kw = _pop_params(kw, self._parse_downsample)
+        x, y, z = self._parse_downsample(x, y, z, **downsample_kw)
         contour_kw = _pop_kwargs(kw, 'edgecolors', 'linewidths', 'linestyles')
         edgefix_kw = _pop_params(kw, self._fix_patch_edges)
         labels_kw = _pop_params(kw, self._add_auto_labels)
@@ -3884,6 +4087,8 @@ class PlotAxes(base.Axes):
         x, y, z, kw = self._parse_2d_args(x, y, z, edges=True, **kwargs)
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(x, y, z, to_centers=True, **kw)
+        downsample_kw = _pop_params(kw, self._parse_downsample)
+        x, y, z = self._parse_downsample(x, y, z, **downsample_kw)
         edgefix_kw = _pop_params(kw, self._fix_patch_edges)
         labels_kw = _pop_params(kw, self._add_auto_labels)
         guide_kw = _pop_params(kw, self._update_guide)
@@ -3904,6 +4109,8 @@ class PlotAxes(base.Axes):
         x, y, z, kw = self._parse_2d_args(x, y, z, edges=True, **kwargs)
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(x, y, z, to_centers=True, **kw)
+        downsample_kw = _pop_params(kw, self._parse_downsample)
+        x, y, z = self._parse_downsample(x, y, z, **downsample_kw)
         edgefix_kw = _pop_params(kw, self._fix_patch_edges)
         labels_kw = _pop_params(kw, self._add_auto_labels)
         guide_kw = _pop_params(kw, self._update_guide)
@@ -3924,6 +4131,8 @@ class PlotAxes(base.Axes):
         x, y, z, kw = self._parse_2d_args(x, y, z, edges=True, **kwargs)
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(x, y, z, to_centers=True, **kw)
+        downsample_kw = _pop_params(kw, self._parse_downsample)
+        x, y, z = self._parse_downsample(x, y, z, **downsample_kw)
         edgefix_kw = _pop_params(kw, self._fix_patch_edges)
         labels_kw = _pop_params(kw, self._add_auto_labels)
         guide_kw = _pop_params(kw, self._update_guide)
@@ -4124,6 +4333,16 @@ class PlotAxes(base.Axes):
         """
         kw = kwargs.copy()
         kw = self._parse_cmap(z, default_discrete=False, **kw)
+        downsample_kw = _pop_params(kw, self._parse_downsample)
+        if np.ndim(z) >= 2:  # preserve the default extent using grid box edges
+            ny, nx = np.shape(z)[:2]
+            x, y = np.arange(nx + 1) - 0.5, np.arange(ny + 1) - 0.5
+            x, y, z = self._parse_downsample(x, y, z, **downsample_kw)
+            coarsened = x.size != nx + 1 or y.size != ny + 1
+            if coarsened and kw.get('extent', None) is None:
+                origin = _not_none(kw.get('origin', None), rc['image.origin'])
+                y = y if origin == 'lower' else y[::-1]
+                kw['extent'] = (x[0], x[-1], y[0], y[-1])
         guide_kw = _pop_params(kw, self._update_guide)
         m = self._call_native('imshow', z, **kw)
         self._update_guide(m, queue_colorbar=False, **guide_kw)
@@ -4203,6 +4422,11 @@ class PlotAxes(base.Axes):
             a = tuple(a if not is_array(a) or a.ndim < 2 else a[..., i] for a in args)
             yield (i, n, *a, kw)
 
+    def draw(self, renderer=None, *args, **kwargs):
+        # Draw lines plotted with decimate=True using only the needed points
+        with self._decimate_lines():
+            super().draw(renderer, *args, **kwargs)
+
     # Related parsing functions for warnings
     _level_parsers = (_parse_level_vals, _parse_level_num, _parse_level_lim)
 
@@ -162,6 +162,10 @@ class _SharedAxes(object):
             self.tick_params(axis=axis, which=which, **kwticks, **kwlines, **kwtext)
 
         # Apply settings that can't be controlled with tick_params
+        # NOTE: Here we avoid get_ticklabels() since it calls the locator and
+        # formatter and instantiates every tick. Matplotlib copies the properties
+        # of the first tick when adding new ticks so we only need existing ticks.
         if kwtext_extra:
-            for lab in obj.get_ticklabels():
-                lab.update(kwtext_extra)
+            for tick in obj.majorTicks:
+                for lab in (tick.label1, tick.label2):
+                    lab.update(kwtext_extra)
@@ -38,7 +38,16 @@ from .internals import (
     inputs,
     warnings,
 )
-from .utils import set_alpha, to_hex, to_rgb, to_rgba, to_xyz, to_xyza
+from .utils import (
+    _to_rgb_array,
+    _to_xyz_array,
+    set_alpha,
+    to_hex,
+    to_rgb,
+    to_rgba,
+    to_xyz,
+    to_xyza,
+)
 
 __all__ = [
     'DiscreteColormap',
@@ -629,7 +638,6 @@ def _standardize_colors(input, space, margin):
     """
     output = {}
     colors = []
-    channels = []
 
     # Always add these colors and ignore other colors that are too close
     # We do this for colors with nice names or that proplot devs really like
@@ -640,7 +648,6 @@ def _standardize_colors(input, space, margin):
         if 'grey' in name:
             name = name.replace('grey', 'gray')
         colors.append((name, color))
-        channels.append(to_xyz(color, space=space))
         output[name] = color  # required in case "kept" colors are close to each other
 
     # Translate remaining colors and remove bad names
@@ -654,12 +661,13 @@ def _standardize_colors(input, space, margin):
         if name in output:
             continue  # prioritize names that come first
         colors.append((name, color))  # category name pair
-        channels.append(to_xyz(color, space=space))
 
     # Get locations of "perceptually distinct" colors
-    channels = np.asarray(channels)
-    if not channels.size:
+    # NOTE: Translate all colors at once rather than calling to_xyz for each color
+    if not colors:
         return output
+    channels = mcolors.to_rgba_array([color for _, color in colors])[:, :3]
+    channels = _to_xyz_array(channels, space=space)
     channels = channels / np.array([360, 100, 100])
     channels = np.round(channels / margin).astype(np.int64)
     _, idxs = np.unique(channels, return_index=True, axis=0)
@@ -1979,8 +1987,9 @@ class PerceptualColormap(ContinuousColormap):
         self._isinit = True
 
         # Now convert values to RGB and clip colors
-        for i in range(self.N + 3):
-            self._lut[i, :3] = to_rgb(self._lut[i, :3], self._space)
+        # NOTE: Conversion is vectorized over the entire lookup table. Impossible
+        # colors are left unclipped here so that _clip_colors can respect 'clip'.
+        self._lut[:, :3] = _to_rgb_array(self._lut[:, :3], self._space, clip=False)
         self._lut[:, :3] = _clip_colors(self._lut[:, :3], self._clip)
 
     @docstring._snippet_manager
@@ -2988,11 +2997,24 @@ class ColorDatabase(MutableMapping, dict):
         return self._cache
 
 
+class _LazyColormap(object):
+    """
+    Placeholder for a registered colormap that is constructed on first access.
+    """
+    def __init__(self, loader, *args):
+        self._loader = loader
+        self._args = args
+
+    def _load(self):
+        return self._loader(*self._args)
+
+
 class ColormapDatabase(MutableMapping, dict):
     """
     Dictionary subclass used to replace the matplotlib
     colormap registry. See `~ColormapDatabase.__getitem__` and
-    `~ColormapDatabase.__setitem__` for details.
+    `~ColormapDatabase.__setitem__` for details. Colormaps registered
+    from the default proplot data files are constructed on first access.
     """
     _regex_grays = re.compile(r'\A(grays)(_r|_s)*\Z', flags=re.IGNORECASE)
     _regex_suffix = re.compile(r'(_r|_s)*\Z', flags=re.IGNORECASE)
@@ -3116,6 +3138,8 @@ class ColormapDatabase(MutableMapping, dict):
                 + ', '.join(map(repr, self))
                 + '.'
             )
+        if isinstance(value, _LazyColormap):
+            value = self._load_item(key, value)
         # Modify colormap
         if reverse:
             value = value.reversed()
@@ -3135,6 +3159,27 @@ class ColormapDatabase(MutableMapping, dict):
         value = _translate_cmap(value)
         dict.__setitem__(self, key, value)
 
+    def _set_lazy(self, key, loader, *args):
+        """
+        Add a placeholder that constructs the colormap with ``loader(*args)``
+        the first time it is requested.
+        """
+        if not isinstance(key, str):
+            raise KeyError(f'Invalid key {key!r}. Must be string.')
+        key = self._translate_key(key, mirror=False)
+        dict.__setitem__(self, key, _LazyColormap(loader, *args))
+
+    def _load_item(self, key, value):
+        """
+        Construct the colormap from the placeholder and replace the placeholder.
+        """
+        cmap = value._load()
+        if not isinstance(cmap, mcolors.Colormap):
+            raise KeyError(f'Failed to load colormap or color cycle {key!r}.')
+        cmap = _translate_cmap(cmap)
+        dict.__setitem__(self, key, cmap)
+        return cmap
+
 
 # Initialize databases
 _cmap_database = _init_cmap_database()
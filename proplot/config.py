@@ -10,11 +10,15 @@ See the :ref:`configuration guide <ug_config>` for details.
 # Because I think it makes sense to have all the code that "runs" (i.e. not
 # just definitions) in the same place, and I was having issues with circular
 # dependencies and where import order of __init__.py was affecting behavior.
+import contextlib
+import itertools
 import logging
+import operator
 import os
+import pickle
 import re
 import sys
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from collections.abc import MutableMapping
 from numbers import Real
 
@@ -38,6 +42,7 @@ from .internals import (
     rcsetup,
     warnings,
 )
+from .internals.benchmarks import _benchmark
 
 try:
     from IPython import get_ipython
@@ -75,6 +80,11 @@ COLORS_KEEP = (
     'white',
     'black'
 )
+CACHE_GENERATIONS = 8  # number of recent generations with cached setting lookups
+_missing = object()  # sentinel for validating cached settings
+_RcContext = namedtuple(
+    'RcContext', ('mode', 'kwargs', 'rc_new', 'rc_old', 'generation')
+)
 
 # Configurator docstrings
 _rc_docstring = """
@@ -214,6 +224,114 @@ def _iter_data_objects(folder, *args, **kwargs):
             raise FileNotFoundError(f'Invalid file path {path!r}.')
 
 
+def _get_cache_key(objects, *args):
+    """
+    Return a key identifying the data files and settings used to build a registry.
+    The key changes whenever proplot, matplotlib, or any of the files change.
+    """
+    from . import __version__
+    from . import colors as pcolors
+    key = [__version__, mpl.__version__, os.path.getmtime(pcolors.__file__), *args]
+    for i, path in objects:
+        stat = os.stat(path)
+        key.append((i, path, stat.st_mtime_ns, stat.st_size))
+    return tuple(key)
+
+
+def _get_cache_file(name):
+    """
+    Return the path to the registry cache file stored alongside matplotlib's caches.
+    """
+    return os.path.join(mpl.get_cachedir(), f'proplot-{name}.pkl')
+
+
+def _load_cache(name, key):
+    """
+    Return the cached registry data or ``None`` if the cache is missing or stale.
+    """
+    try:
+        with open(_get_cache_file(name), 'rb') as fh:
+            cache = pickle.load(fh)
+    except Exception:  # missing, corrupted, or incompatible cache
+        return None
+    if not isinstance(cache, dict) or cache.get('key') != key:
+        return None
+    return cache['data']
+
+
+def _save_cache(name, key, data):
+    """
+    Save the registry data to the cache. Fails silently if the cache is unwritable.
+    """
+    # NOTE: Write to a temporary file then atomically replace the cache
+    # so that simultaneous imports never read a partially written file.
+    path = _get_cache_file(name)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as fh:
+            pickle.dump({'key': key, 'data': data}, fh, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def _get_font_key(paths, fnames):
+    """
+    Return a key identifying the font folders, font files, and matplotlib font
+    cache, or ``None`` if the matplotlib version does not support `addfont`.
+    """
+    # NOTE: Adding, removing, or renaming font files changes the modification time
+    # of the parent folder, so we can avoid listing the files. Since findSystemFonts
+    # also searches subfolders (e.g. one folder per font family) we include every
+    # folder below the input folders. Include the matplotlib font cache so that
+    # matplotlib rebuilds are always detected.
+    version = getattr(mfonts.FontManager, '__version__', None)
+    if version is None or not hasattr(mfonts.fontManager, 'addfont'):
+        return None
+    cache = os.path.join(mpl.get_cachedir(), f'fontlist-v{version}.json')
+    objects = [
+        (0, folder)
+        for path in paths if os.path.isdir(path)
+        for folder in sorted(folder for folder, _, _ in os.walk(path))
+    ]
+    objects.extend((1, path) for path in fnames)
+    if os.path.isfile(cache):
+        objects.append((2, cache))
+    return _get_cache_key(objects, tuple(paths), version)
+
+
+def _get_lazy_name(path):
+    """
+    Return the registered name for a default colormap or cycle file that can be
+    loaded lazily, or ``None`` if the file should be loaded immediately.
+    """
+    # NOTE: This must be consistent with the name parsing in _Colormap._from_file
+    name, ext = os.path.splitext(os.path.basename(path))
+    if ext[1:] not in ('json', 'txt', 'rgb', 'xml', 'hex'):
+        return None
+    if name[-2:] == '_r':
+        name = name[:-2]
+    return name
+
+
+def _load_cmap(cls, path):
+    """
+    Load a default colormap or cycle file on first access. See `register_cmaps`.
+    """
+    from . import colors as pcolors
+    cmap = cls.from_file(path, warn_on_failure=True)
+    if (
+        cmap
+        and cls is pcolors.ContinuousColormap
+        and cmap.name.lower() in pcolors.CMAPS_CYCLIC
+    ):
+        cmap.set_cyclic(True)
+    return cmap
+
+
 def _filter_style_dict(rcdict, warn=True):
     """
     Filter out blacklisted style parameters.
@@ -428,6 +546,7 @@ def use_style(style):
     kw_matplotlib = _get_style_dict(style)
     rc_matplotlib.update(kw_matplotlib)
     rc_proplot.update(_infer_proplot_dict(kw_matplotlib))
+    rc._set_generation()
 
 
 @docstring._snippet_manager
@@ -462,14 +581,33 @@ def register_cmaps(*args, user=None, local=None, default=False):
             paths.append(arg)
 
     # Register data files
+    # NOTE: Parsing the data files is the biggest import time bottleneck. So the
+    # default colormaps are only parsed when first requested from the database,
+    # and the user and local colormaps are cached and re-parsed if files change.
+    objects = []
     for i, path in _iter_data_objects(
         'cmaps', *paths, user=user, local=local, default=default
     ):
-        cmap = pcolors.ContinuousColormap.from_file(path, warn_on_failure=True)
-        if not cmap:
-            continue
-        if i == 0 and cmap.name.lower() in pcolors.CMAPS_CYCLIC:
-            cmap.set_cyclic(True)
+        name = _get_lazy_name(path) if i == 0 else None
+        if name is None:
+            objects.append((i, path))
+        else:
+            pcolors._cmap_database._set_lazy(
+                name, _load_cmap, pcolors.ContinuousColormap, path
+            )
+    key = None if paths or not objects else _get_cache_key(objects)
+    cmaps = key and _load_cache('cmaps', key)
+    if cmaps is None:
+        cmaps = []
+        for _, path in objects:
+            with _benchmark(os.path.dirname(path)):  # record slow user folders
+                cmap = pcolors.ContinuousColormap.from_file(path, warn_on_failure=True)
+            if not cmap:
+                continue
+            cmaps.append(cmap)
+        if key:
+            _save_cache('cmaps', key, cmaps)
+    for cmap in cmaps:
         pcolors._cmap_database[cmap.name] = cmap
 
 
@@ -505,12 +643,30 @@ def register_cycles(*args, user=None, local=None, default=False):
             paths.append(arg)
 
     # Register data files
-    for _, path in _iter_data_objects(
+    objects = []
+    for i, path in _iter_data_objects(
         'cycles', *paths, user=user, local=local, default=default
     ):
-        cmap = pcolors.DiscreteColormap.from_file(path, warn_on_failure=True)
-        if not cmap:
-            continue
+        name = _get_lazy_name(path) if i == 0 else None
+        if name is None:
+            objects.append((i, path))
+        else:
+            pcolors._cmap_database._set_lazy(
+                name, _load_cmap, pcolors.DiscreteColormap, path
+            )
+    key = None if paths or not objects else _get_cache_key(objects)
+    cmaps = key and _load_cache('cycles', key)
+    if cmaps is None:
+        cmaps = []
+        for _, path in objects:
+            with _benchmark(os.path.dirname(path)):  # record slow user folders
+                cmap = pcolors.DiscreteColormap.from_file(path, warn_on_failure=True)
+            if not cmap:
+                continue
+            cmaps.append(cmap)
+        if key:
+            _save_cache('cycles', key, cmaps)
+    for cmap in cmaps:
         pcolors._cmap_database[cmap.name] = cmap
 
 
@@ -579,24 +735,86 @@ def register_colors(
 
     # Load colors from file and get their HCL values
     # NOTE: Colors that come *later* overwrite colors that come earlier.
-    for i, path in _iter_data_objects(
+    # NOTE: The filtered colors are cached along with the settings used to filter
+    # them so that _standardize_colors is only run when something changes.
+    objects = list(_iter_data_objects(
         'colors', *paths, user=user, local=local, default=default
-    ):
-        loaded = pcolors._load_colors(path, warn_on_failure=True)
+    ))
+    key = None if paths else _get_cache_key(objects, space, margin)
+    loadeds = key and _load_cache('colors', key)
+    if loadeds is None:
+        loadeds = []
+        for i, path in objects:
+            with _benchmark(os.path.dirname(path)):  # record slow user folders
+                loaded = pcolors._load_colors(path, warn_on_failure=True)
+            if i == 0:
+                cat, _ = os.path.splitext(os.path.basename(path))
+                if cat not in srcs:
+                    raise RuntimeError(f'Unknown proplot color database {path!r}.')
+                if cat == 'xkcd':
+                    for name in COLORS_KEEP:
+                        loaded[name] = pcolors._color_database[name]  # keep the same
+                    loaded = pcolors._standardize_colors(loaded, space, margin)
+            loadeds.append((i, path, loaded))
+        if key:
+            _save_cache('colors', key, loadeds)
+    for i, path, loaded in loadeds:
         if i == 0:
             cat, _ = os.path.splitext(os.path.basename(path))
-            if cat not in srcs:
-                raise RuntimeError(f'Unknown proplot color database {path!r}.')
             src = srcs[cat]
-            if cat == 'xkcd':
-                for key in COLORS_KEEP:
-                    loaded[key] = pcolors._color_database[key]  # keep the same
-                loaded = pcolors._standardize_colors(loaded, space, margin)
             src.clear()
             src.update(loaded)  # needed for demos.show_colors()
         pcolors._color_database.update(loaded)
 
 
+def _add_fonts(paths, fnames):
+    """
+    Add the fonts in the input folders and files to the font manager and rebuild
+    the matplotlib font cache if necessary. Return the sorted ignored .ttc files.
+    """
+    fnames_proplot = set(mfonts.findSystemFonts(paths))
+    fnames_proplot.update(fnames)
+    fnames_proplot_ttc = {
+        file for file in fnames_proplot if os.path.splitext(file)[1] == '.ttc'
+    }
+
+    # Rebuild font cache only if necessary! Can be >50% of total import time!
+    fnames_all = {font.fname for font in mfonts.fontManager.ttflist}
+    fnames_proplot -= fnames_proplot_ttc
+    if not fnames_all >= fnames_proplot:
+        warnings._warn_proplot(
+            'Rebuilding font cache. This usually happens '
+            'after installing or updating proplot.'
+        )
+        if hasattr(mfonts.fontManager, 'addfont'):
+            # Newer API lets us add font files manually and deprecates TTFPATH. However
+            # to cache fonts added this way, we must call json_dump explicitly.
+            # NOTE: Previously, cache filename was specified as _fmcache variable, but
+            # recently became inaccessible. Must reproduce mpl code instead.
+            # NOTE: Older mpl versions used fontList.json as the cache, but these
+            # versions also did not have 'addfont', so makes no difference.
+            for fname in fnames_proplot:
+                mfonts.fontManager.addfont(fname)
+            cache = os.path.join(
+                mpl.get_cachedir(),
+                f'fontlist-v{mfonts.FontManager.__version__}.json'
+            )
+            mfonts.json_dump(mfonts.fontManager, cache)
+        else:
+            # Older API requires us to modify TTFPATH
+            # NOTE: Previously we tried to modify TTFPATH before importing
+            # font manager with hope that it would load proplot fonts on
+            # initialization. But 99% of the time font manager just imports
+            # the FontManager from cache, so we would have to rebuild anyway.
+            paths = ':'.join(paths)
+            if 'TTFPATH' not in os.environ:
+                os.environ['TTFPATH'] = paths
+            elif paths not in os.environ['TTFPATH']:
+                os.environ['TTFPATH'] += ':' + paths
+            mfonts._rebuild()
+    return sorted(fnames_proplot_ttc)
+
+
 @docstring._snippet_manager
 def register_fonts(*args, user=True, local=True, default=False):
     """
@@ -627,61 +845,34 @@ def register_fonts(*args, user=True, local=True, default=False):
     paths_proplot = _get_data_folders(
         'fonts', user=user, local=local, default=default, reverse=True
     )
-    fnames_proplot = set(mfonts.findSystemFonts(paths_proplot))
+    fnames_args = []
     for path in args:
         path = os.path.expanduser(path)
         if os.path.isfile(path):
-            fnames_proplot.add(path)
+            fnames_args.append(path)
         else:
             raise FileNotFoundError(f'Invalid font file path {path!r}.')
 
+    # Skip the folder scan and font cache check if nothing has changed
+    # NOTE: The cached data is the list of ignored .ttc files so that the
+    # warning below is issued consistently across sessions.
+    key = _get_font_key(paths_proplot, fnames_args)
+    fnames_proplot_ttc = None if key is None else _load_cache('fonts', key)
+    if fnames_proplot_ttc is None:
+        fnames_proplot_ttc = _add_fonts(paths_proplot, fnames_args)
+        key = _get_font_key(paths_proplot, fnames_args)  # font cache may change
+        if key is not None:
+            _save_cache('fonts', key, fnames_proplot_ttc)
+
     # Detect user-input ttc fonts and issue warning
-    fnames_proplot_ttc = {
-        file for file in fnames_proplot if os.path.splitext(file)[1] == '.ttc'
-    }
     if fnames_proplot_ttc:
         warnings._warn_proplot(
             'Ignoring the following .ttc fonts because they cannot be '
             'saved into PDF or EPS files (see matplotlib issue #3135): '
-            + ', '.join(map(repr, sorted(fnames_proplot_ttc)))
+            + ', '.join(map(repr, fnames_proplot_ttc))
             + '. Please consider expanding them into separate .ttf files.'
         )
 
-    # Rebuild font cache only if necessary! Can be >50% of total import time!
-    fnames_all = {font.fname for font in mfonts.fontManager.ttflist}
-    fnames_proplot -= fnames_proplot_ttc
-    if not fnames_all >= fnames_proplot:
-        warnings._warn_proplot(
-            'Rebuilding font cache. This usually happens '
-            'after installing or updating proplot.'
-        )
-        if hasattr(mfonts.fontManager, 'addfont'):
-            # Newer API lets us add font files manually and deprecates TTFPATH. However
-            # to cache fonts added this way, we must call json_dump explicitly.
-            # NOTE: Previously, cache filename was specified as _fmcache variable, but
-            # recently became inaccessible. Must reproduce mpl code instead.
-            # NOTE: Older mpl versions used fontList.json as the cache, but these
-            # versions also did not have 'addfont', so makes no difference.
-            for fname in fnames_proplot:
-                mfonts.fontManager.addfont(fname)
-            cache = os.path.join(
-                mpl.get_cachedir(),
-                f'fontlist-v{mfonts.FontManager.__version__}.json'
-            )
-            mfonts.json_dump(mfonts.fontManager, cache)
-        else:
-            # Older API requires us to modify TTFPATH
-            # NOTE: Previously we tried to modify TTFPATH before importing
-            # font manager with hope that it would load proplot fonts on
-            # initialization. But 99% of the time font manager just imports
-            # the FontManager from cache, so we would have to rebuild anyway.
-            paths = ':'.join(paths_proplot)
-            if 'TTFPATH' not in os.environ:
-                os.environ['TTFPATH'] = paths
-            elif paths not in os.environ['TTFPATH']:
-                os.environ['TTFPATH'] += ':' + paths
-            mfonts._rebuild()
-
     # Remove ttc files and 'Thin' fonts *after* rebuild
     # NOTE: 'Thin' filter is ugly kludge but without this matplotlib picks up on
     # Roboto thin ttf files installed on the RTD server when compiling docs.
@@ -734,6 +925,13 @@ class Configurator(MutableMapping, dict):
         %(rc.params)s
         """
         self._context = []
+        self._generation = 0
+        self._generations = itertools.count(1)
+        self._caches = OrderedDict()  # lookup caches for recent generations
+        self._snapshots = OrderedDict()  # setting values for recent generations
+        self._category_keys = {}  # setting names for each category
+        self._plan = None  # active format plan
+        self._plans = (None, {})  # generation and recorded format plan
         self._init(local=local, user=user, default=default, **kwargs)
 
     def __getitem__(self, key):
@@ -741,12 +939,7 @@ class Configurator(MutableMapping, dict):
         Return an `rc_matplotlib` or `rc_proplot` setting using dictionary notation
         (e.g., ``value = pplt.rc[name]``).
         """
-        key, _ = self._validate_key(key)  # might issue proplot removed/renamed error
-        try:
-            return rc_proplot[key]
-        except KeyError:
-            pass
-        return rc_matplotlib[key]  # might issue matplotlib removed/renamed error
+        return self._get_item_cached(key, None)
 
     def __setitem__(self, key, value):
         """
@@ -756,6 +949,7 @@ class Configurator(MutableMapping, dict):
         kw_proplot, kw_matplotlib = self._get_item_dicts(key, value)
         rc_proplot.update(kw_proplot)
         rc_matplotlib.update(kw_matplotlib)
+        self._set_generation()
 
     def __getattr__(self, attr):
         """
@@ -788,7 +982,14 @@ class Configurator(MutableMapping, dict):
         context = self._context[-1]
         kwargs = context.kwargs
         rc_new = context.rc_new  # used for context-based _get_item_context
-        rc_old = context.rc_old  # used to re-apply settings without copying whole dict
+        rc_old = context.rc_old  # used to restore settings without copying whole dict
+        # NOTE: Lookups are cached by key and context mode, so blocks without new
+        # settings (e.g. the ones opened by every format() call) keep the generation
+        # and reuse the cached lookups.
+        generation = entered = self._generation
+        if kwargs:
+            entered = self._set_generation()
+        context.generation[:] = (generation, entered)
         for key, value in kwargs.items():
             kw_proplot, kw_matplotlib = self._get_item_dicts(key, value)
             for rc_dict, kw_new in zip(
@@ -796,7 +997,8 @@ class Configurator(MutableMapping, dict):
                 (kw_proplot, kw_matplotlib),
             ):
                 for key, value in kw_new.items():
-                    rc_old[key] = rc_dict[key]
+                    if key not in rc_old:  # record the value before the block
+                        rc_old[key] = (rc_dict, dict.__getitem__(rc_dict, key))
                     rc_new[key] = rc_dict[key] = value
 
     def __exit__(self, *args):  # noqa: U100
@@ -807,12 +1009,71 @@ class Configurator(MutableMapping, dict):
             raise RuntimeError(
                 'rc object must be initialized for context block using rc.context().'
             )
+        # NOTE: The recorded values were already expanded into child settings and
+        # validated when they were assigned, so we restore them with direct writes.
+        # Settings with side effects outside of the dictionaries are reapplied.
         context = self._context[-1]
-        for key, value in context.rc_old.items():
-            kw_proplot, kw_matplotlib = self._get_item_dicts(key, value)
-            rc_proplot.update(kw_proplot)
-            rc_matplotlib.update(kw_matplotlib)
+        for key, (rc_dict, value) in context.rc_old.items():
+            dict.__setitem__(rc_dict, key, value)
+            if key == 'inlineformat':
+                config_inline_backend(value)
         del self._context[-1]
+        generation, entered = context.generation or (None, None)
+        if self._generation == entered:  # settings were only changed by the block
+            self._generation = generation
+        else:
+            self._set_generation()
+
+    def _set_generation(self, keep_plan=False):
+        """
+        Assign a new generation number after the settings have changed.
+        """
+        self._generation = next(self._generations)
+        if not keep_plan:
+            self._plan = None
+        return self._generation
+
+    def _get_cache(self):
+        """
+        Return the lookup cache for the current generation or the format plan.
+        """
+        if self._plan is not None:
+            return self._plan
+        caches = self._caches
+        generation = self._generation
+        if caches and next(reversed(caches)) == generation:
+            return caches[generation]
+        cache = caches.get(generation)
+        if cache is None:
+            cache = caches[generation] = {}
+            while len(caches) > CACHE_GENERATIONS:
+                caches.popitem(last=False)
+        else:
+            caches.move_to_end(generation)
+        return cache
+
+    @contextlib.contextmanager
+    def _with_format_plan(self, enabled=True):
+        """
+        Record the settings looked up while applying default formatting to new axes
+        and reuse them for subsequent axes until the settings are changed.
+        """
+        # NOTE: Settings in the recorded "plan" are keyed by name and context mode.
+        # This is only valid when the lookups depend on nothing but the settings,
+        # so callers disable it when passing format() keywords, and context blocks
+        # that apply new settings or assignments to rc disable it until it ends.
+        if not enabled or self._plan is not None:
+            yield
+            return
+        generation, plan = self._plans
+        if generation != self._generation:
+            plan = {}
+            self._plans = (self._generation, plan)
+        self._plan = plan
+        try:
+            yield
+        finally:
+            self._plan = None
 
     def _init(self, *, local, user, default, skip_cycle=False):
         """
@@ -848,6 +1109,7 @@ class Configurator(MutableMapping, dict):
                 if path == user_path:  # local files always have precedence
                     continue
                 self.load(path)
+        self._set_generation()
 
     @staticmethod
     def _validate_key(key, value=None):
@@ -891,9 +1153,51 @@ class Configurator(MutableMapping, dict):
         As with `~Configurator.__getitem__` but the search is limited based
         on the context mode and ``None`` is returned if the key is not found.
         """
-        key, _ = self._validate_key(key)
         if mode is None:
             mode = self._context_mode
+        return self._get_item_cached(key, mode)
+
+    def _get_item_cached(self, key, mode):
+        """
+        Return the setting from the lookup cache or search for it and cache the
+        result. Use ``mode=None`` for `~Configurator.__getitem__` lookups.
+        """
+        # NOTE: The cache for the current generation only changes when settings
+        # are assigned with rc or context blocks are entered. Settings found in
+        # rc_proplot or rc_matplotlib are also checked against the source dictionary
+        # by identity in case they were modified directly (e.g. by rc_context()).
+        cache = self._get_cache()
+        item = cache.get((key, mode))
+        if item is not None:
+            value, rcdict, name = item
+            if rcdict is None or dict.get(rcdict, name, _missing) is value:
+                return value
+        if mode is None:
+            item = self._get_item_source(key)
+        else:
+            item = self._get_item_context_source(key, mode)
+        cache[key, mode] = item
+        return item[0]
+
+    def _get_item_source(self, key):
+        """
+        Return an `rc_matplotlib` or `rc_proplot` setting, the dictionary
+        it was found in, and the setting name within that dictionary.
+        """
+        key, _ = self._validate_key(key)  # might issue proplot removed/renamed error
+        try:
+            return rc_proplot[key], rc_proplot, key
+        except KeyError:
+            pass
+        value = rc_matplotlib[key]  # might issue matplotlib removed/renamed error
+        return value, rc_matplotlib, key
+
+    def _get_item_context_source(self, key, mode):
+        """
+        As with `~Configurator._get_item_source` but the search is limited based on
+        the context mode and ``None`` is returned if the key is not found.
+        """
+        key, _ = self._validate_key(key)
         cache = tuple(context.rc_new for context in self._context)
         if mode == 0:
             rcdicts = (*cache, rc_proplot, rc_matplotlib)
@@ -907,11 +1211,12 @@ class Configurator(MutableMapping, dict):
             if not rcdict:
                 continue
             try:
-                return rcdict[key]
+                return rcdict[key], rcdict, key
             except KeyError:
                 continue
         if mode == 0:  # otherwise return None
             raise KeyError(f'Invalid rc setting {key!r}.')
+        return None, None, key
 
     def _get_item_dicts(self, key, value, skip_cycle=False):
         """
@@ -1425,8 +1730,9 @@ class Configurator(MutableMapping, dict):
         # Activate context object
         if mode not in range(3):
             raise ValueError(f'Invalid mode {mode!r}.')
-        cls = namedtuple('RcContext', ('mode', 'kwargs', 'rc_new', 'rc_old'))
-        context = cls(mode=mode, kwargs=kwargs, rc_new={}, rc_old={})
+        context = _RcContext(
+            mode=mode, kwargs=kwargs, rc_new={}, rc_old={}, generation=[]
+        )
         self._context.append(context)
         return self
 
@@ -1457,14 +1763,18 @@ class Configurator(MutableMapping, dict):
                 + ', '.join(map(repr, rcsetup._rc_categories))
                 + '.'
             )
-        for key in self:
-            if not re.match(fr'\A{cat}\.[^.]+\Z', key):
-                continue
-            value = self._get_item_context(key, None if context else 0)
+        keys = self._category_keys.get(cat)
+        if keys is None:  # the setting names never change
+            keys = self._category_keys[cat] = tuple(
+                key for key in self if re.match(fr'\A{cat}\.[^.]+\Z', key)
+            )
+        mode = self._context_mode if context else 0
+        for key in keys:
+            value = self._get_item_cached(key, mode)
             if value is None:
                 continue
             if trimcat:
-                key = re.sub(fr'\A{cat}\.', '', key)
+                key = key[len(cat) + 1:]
             kw[key] = value
         return kw
 
@@ -1488,8 +1798,9 @@ class Configurator(MutableMapping, dict):
         Configurator.find
         """
         kw = {}
+        mode = self._context_mode if context else 0
         for key, value in props.items():
-            item = self._get_item_context(value, None if context else 0)
+            item = self._get_item_cached(value, mode)
             if item is not None:
                 kw[key] = item
         return kw
@@ -1720,6 +2031,47 @@ class Configurator(MutableMapping, dict):
         """
         return max((context.mode for context in self._context), default=0)
 
+    def _check_generation(self):
+        """
+        Assign a new generation number if settings were changed directly in
+        `rc_matplotlib` or `rc_proplot` since the generation was last checked.
+        """
+        # NOTE: Assignments and context blocks update the generation immediately. To
+        # detect direct modifications we record the value identities for each recent
+        # generation. This requires a pass over every setting so it is only called at
+        # the start of format() calls and figure draws rather than on every access.
+        generation = self._generation
+        values = (*dict.values(rc_proplot), *dict.values(rc_matplotlib))
+        snapshots = self._snapshots
+        snapshot = snapshots.get(generation)
+        if snapshot is not None and (
+            len(snapshot) != len(values)
+            or not all(map(operator.is_, snapshot, values))
+        ):
+            generation = self._set_generation()
+        snapshots[generation] = values
+        snapshots.move_to_end(generation)
+        while len(snapshots) > CACHE_GENERATIONS:
+            snapshots.popitem(last=False)
+        return generation
+
+    @property
+    def generation(self):
+        """
+        An integer that changes whenever the settings are changed. This can be used
+        as a key for caches that depend on the settings. Context blocks that are
+        exited restore the number from before the block unless settings were changed
+        inside. Settings replaced directly in `rc_matplotlib` or `rc_proplot` (e.g.
+        with `matplotlib.rc_context`) are only detected at the start of
+        `~proplot.axes.Axes.format` calls and figure draws, and settings modified
+        in-place (e.g. appending to the ``'font.sans-serif'`` list) are not detected.
+
+        See also
+        --------
+        Configurator.context
+        """
+        return self._generation
+
     @property
     def changed(self):
         """
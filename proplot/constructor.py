@@ -13,6 +13,7 @@ The constructor functions used to build class instances from simple shorthand ar
 import copy
 import os
 import re
+from collections.abc import MutableMapping
 from functools import partial
 from numbers import Number
 
@@ -25,25 +26,21 @@ import matplotlib.ticker as mticker
 import numpy as np
 
 from . import colors as pcolors
-from . import proj as pproj
 from . import scale as pscale
 from . import ticker as pticker
 from .config import rc
 from .internals import ic  # noqa: F401
-from .internals import _not_none, _pop_props, _version_cartopy, _version_mpl, warnings
+from .internals import (
+    _has_module,
+    _is_instance,
+    _not_none,
+    _pop_props,
+    _version_cartopy,
+    _version_mpl,
+    warnings,
+)
 from .utils import get_colors, to_hex, to_rgba
 
-try:
-    from mpl_toolkits.basemap import Basemap
-except ImportError:
-    Basemap = object
-try:
-    import cartopy.crs as ccrs
-    from cartopy.crs import Projection
-except ModuleNotFoundError:
-    ccrs = None
-    Projection = object
-
 __all__ = [
     'Proj',
     'Locator',
@@ -227,75 +224,118 @@ PROJ_DEFAULTS = {
         'lon_1': 0, 'lon_2': 0, 'width': 10000e3, 'height': 10000e3
     },
 }
-if ccrs is None:
-    PROJS = {}
-else:
-    PROJS = {
-        'aitoff': pproj.Aitoff,
-        'hammer': pproj.Hammer,
-        'kav7': pproj.KavrayskiyVII,
-        'wintri': pproj.WinkelTripel,
-        'npgnom': pproj.NorthPolarGnomonic,
-        'spgnom': pproj.SouthPolarGnomonic,
-        'npaeqd': pproj.NorthPolarAzimuthalEquidistant,
-        'spaeqd': pproj.SouthPolarAzimuthalEquidistant,
-        'nplaea': pproj.NorthPolarLambertAzimuthalEqualArea,
-        'splaea': pproj.SouthPolarLambertAzimuthalEqualArea,
-    }
-    PROJS_MISSING = {
-        'aea': 'AlbersEqualArea',
-        'aeqd': 'AzimuthalEquidistant',
-        'cyl': 'PlateCarree',  # only basemap name not matching PROJ
-        'eck1': 'EckertI',
-        'eck2': 'EckertII',
-        'eck3': 'EckertIII',
-        'eck4': 'EckertIV',
-        'eck5': 'EckertV',
-        'eck6': 'EckertVI',
-        'eqc': 'PlateCarree',  # actual PROJ name
-        'eqdc': 'EquidistantConic',
-        'eqearth': 'EqualEarth',  # better looking Robinson; not in basemap
-        'euro': 'EuroPP',  # Europe; not in basemap or PROJ
-        'geos': 'Geostationary',
-        'gnom': 'Gnomonic',
-        'igh': 'InterruptedGoodeHomolosine',  # not in basemap
-        'laea': 'LambertAzimuthalEqualArea',
-        'lcc': 'LambertConformal',
-        'lcyl': 'LambertCylindrical',  # not in basemap or PROJ
-        'merc': 'Mercator',
-        'mill': 'Miller',
-        'moll': 'Mollweide',
-        'npstere': 'NorthPolarStereo',  # np/sp stuff not in PROJ
-        'nsper': 'NearsidePerspective',
-        'ortho': 'Orthographic',
-        'osgb': 'OSGB',  # UK; not in basemap or PROJ
-        'osni': 'OSNI',  # Ireland; not in basemap or PROJ
-        'pcarree': 'PlateCarree',  # common alternate name
-        'robin': 'Robinson',
-        'rotpole': 'RotatedPole',
-        'sinu': 'Sinusoidal',
-        'spstere': 'SouthPolarStereo',
-        'stere': 'Stereographic',
-        'tmerc': 'TransverseMercator',
-        'utm': 'UTM',  # not in basemap
-    }
-    for _key, _cls in tuple(PROJS_MISSING.items()):
-        if hasattr(ccrs, _cls):
-            PROJS[_key] = getattr(ccrs, _cls)
-            del PROJS_MISSING[_key]
-    if PROJS_MISSING:
-        warnings._warn_proplot(
-            'The following cartopy projection(s) are unavailable: '
-            + ', '.join(map(repr, PROJS_MISSING))
-            + ' . Please consider updating cartopy.'
-        )
-    PROJS_TABLE = (
-        'The known cartopy projection classes are:\n'
-        + '\n'.join(
-            ' ' + key + ' ' * (max(map(len, PROJS)) - len(key) + 10) + cls.__name__
-            for key, cls in PROJS.items()
-        )
-    )
+PROJS_PROPLOT = {  # names of classes in proplot.proj
+    'aitoff': 'Aitoff',
+    'hammer': 'Hammer',
+    'kav7': 'KavrayskiyVII',
+    'wintri': 'WinkelTripel',
+    'npgnom': 'NorthPolarGnomonic',
+    'spgnom': 'SouthPolarGnomonic',
+    'npaeqd': 'NorthPolarAzimuthalEquidistant',
+    'spaeqd': 'SouthPolarAzimuthalEquidistant',
+    'nplaea': 'NorthPolarLambertAzimuthalEqualArea',
+    'splaea': 'SouthPolarLambertAzimuthalEqualArea',
+}
+PROJS_CARTOPY = {  # names of classes in cartopy.crs
+    'aea': 'AlbersEqualArea',
+    'aeqd': 'AzimuthalEquidistant',
+    'cyl': 'PlateCarree',  # only basemap name not matching PROJ
+    'eck1': 'EckertI',
+    'eck2': 'EckertII',
+    'eck3': 'EckertIII',
+    'eck4': 'EckertIV',
+    'eck5': 'EckertV',
+    'eck6': 'EckertVI',
+    'eqc': 'PlateCarree',  # actual PROJ name
+    'eqdc': 'EquidistantConic',
+    'eqearth': 'EqualEarth',  # better looking Robinson; not in basemap
+    'euro': 'EuroPP',  # Europe; not in basemap or PROJ
+    'geos': 'Geostationary',
+    'gnom': 'Gnomonic',
+    'igh': 'InterruptedGoodeHomolosine',  # not in basemap
+    'laea': 'LambertAzimuthalEqualArea',
+    'lcc': 'LambertConformal',
+    'lcyl': 'LambertCylindrical',  # not in basemap or PROJ
+    'merc': 'Mercator',
+    'mill': 'Miller',
+    'moll': 'Mollweide',
+    'npstere': 'NorthPolarStereo',  # np/sp stuff not in PROJ
+    'nsper': 'NearsidePerspective',
+    'ortho': 'Orthographic',
+    'osgb': 'OSGB',  # UK; not in basemap or PROJ
+    'osni': 'OSNI',  # Ireland; not in basemap or PROJ
+    'pcarree': 'PlateCarree',  # common alternate name
+    'robin': 'Robinson',
+    'rotpole': 'RotatedPole',
+    'sinu': 'Sinusoidal',
+    'spstere': 'SouthPolarStereo',
+    'stere': 'Stereographic',
+    'tmerc': 'TransverseMercator',
+    'utm': 'UTM',  # not in basemap
+}
+
+
+class _ProjectionDatabase(MutableMapping, dict):
+    """
+    Dictionary of cartopy projection classes populated on first access.
+    """
+    # NOTE: This defers the slow cartopy import until a projection is requested
+    # by name. The dictionary is empty if cartopy is unavailable.
+    def __iter__(self):
+        self._load_items()
+        yield from dict.__iter__(self)
+
+    def __len__(self):
+        self._load_items()
+        return dict.__len__(self)
+
+    def __repr__(self):
+        self._load_items()
+        return dict.__repr__(self)
+
+    def __getitem__(self, key):
+        self._load_items()
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        self._load_items()
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._load_items()
+        dict.__delitem__(self, key)
+
+    def __init__(self):
+        self._loaded = False
+
+    def _load_items(self):
+        """
+        Import cartopy and populate the projection classes.
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+        if not _has_module('cartopy'):
+            return
+        import cartopy.crs as ccrs
+        from . import proj as pproj
+        for key, name in PROJS_PROPLOT.items():
+            dict.__setitem__(self, key, getattr(pproj, name))
+        missing = []
+        for key, name in PROJS_CARTOPY.items():
+            if hasattr(ccrs, name):
+                dict.__setitem__(self, key, getattr(ccrs, name))
+            else:
+                missing.append(key)
+        if missing:
+            warnings._warn_proplot(
+                'The following cartopy projection(s) are unavailable: '
+                + ', '.join(map(repr, missing))
+                + ' . Please consider updating cartopy.'
+            )
+
+
+PROJS = _ProjectionDatabase()
 
 # Geographic feature properties
 FEATURES_CARTOPY = {  # positional arguments passed to NaturalEarthFeature
@@ -1429,8 +1469,8 @@ def Proj(
     lat0 = _not_none(lat0=lat0, lat_0=lat_0)
     lonlim = _not_none(lonlim, default=(None, None))
     latlim = _not_none(latlim, default=(None, None))
-    is_crs = Projection is not object and isinstance(name, Projection)
-    is_basemap = Basemap is not object and isinstance(name, Basemap)
+    is_crs = _is_instance(name, 'cartopy.crs', 'Projection')
+    is_basemap = _is_instance(name, 'mpl_toolkits.basemap', 'Basemap')
     include_axes = kwargs.pop('include_axes', False)  # for error message
     if backend is not None and backend not in ('cartopy', 'basemap'):
         raise ValueError(
@@ -1509,7 +1549,7 @@ def Proj(
     # on initialization and controls *all* features.
     else:
         # Parse input arguments
-        from mpl_toolkits import basemap  # ensure present  # noqa: F401
+        from mpl_toolkits.basemap import Basemap  # ensure present
         if name in ('eqc', 'pcarree'):
             name = 'cyl'  # PROJ package aliases
         defaults = {'fix_aspect': True, **PROJ_DEFAULTS.get(name, {})}
@@ -21,6 +21,7 @@ from . import gridspec as pgridspec
 from .config import rc, rc_matplotlib
 from .internals import ic  # noqa: F401
 from .internals import (
+    _has_module,
     _not_none,
     _pop_params,
     _pop_rc,
@@ -454,8 +455,11 @@ def _add_canvas_preprocessor(canvas, method, cache=False):
                 return
 
         # Adjust layout
+        # NOTE: Check for settings changed directly in rc_matplotlib or rc_proplot
+        # so that caches keyed by the settings generation are refreshed.
         # NOTE: The authorized_context is needed because some backends disable
         # constrained layout or tight layout before printing the figure.
+        rc._check_generation()
         ctx1 = fig._context_adjusting(cache=cache)
         ctx2 = fig._context_authorized()  # skip backend set_constrained_layout()
         ctx3 = rc.context(fig._render_context)  # draw with figure-specific setting
@@ -800,8 +804,8 @@ class Figure(mfigure.Figure):
             name is None
             and backend is None
             and isinstance(proj, str)
-            and constructor.Projection is object
-            and constructor.Basemap is object
+            and not _has_module('cartopy')
+            and not _has_module('mpl_toolkits.basemap')
         ):
             raise ValueError(
                 f'Invalid projection name {proj!r}. If you are trying to generate a '
@@ -1526,6 +1530,7 @@ class Figure(mfigure.Figure):
         proplot.config.Configurator.context
         """
         # Initiate context block
+        rc._check_generation()
         axs = axs or self._subplot_dict.values()
         skip_axes = kwargs.pop('skip_axes', False)  # internal keyword arg
         rc_kw, rc_mode = _pop_rc(kwargs)
@@ -16,7 +16,7 @@ import numpy as np
 from . import axes as paxes
 from .config import rc
 from .internals import ic  # noqa: F401
-from .internals import _not_none, docstring, warnings
+from .internals import _not_none, docstring, inputs, warnings
 from .utils import _fontsize_to_pt, units
 
 __all__ = [
@@ -1549,6 +1549,75 @@ class SubplotGrid(MutableSequence, list):
         """
         self.figure.format(axs=self, **kwargs)
 
+    @docstring._snippet_manager
+    def levels(self, *args, norm=None, norm_kw=None, extend=None, **kwargs):
+        """
+        Return colormap levels suitable for every input data array. These can be
+        passed to the plotting command for each axes in the grid so that each
+        plot uses the same `~proplot.colors.DiscreteNorm` normalization.
+
+        Parameters
+        ----------
+        *args : array-like
+            The data arrays. Arrays with more than two dimensions are treated as
+            stacks of 2D arrays along their leading dimensions (e.g., one 2D slice
+            per subplot). The arrays are scanned one at a time without creating
+            concatenated copies, and the default `vmin` and `vmax` are the
+            minimum and maximum of the individual array limits.
+        norm, norm_kw, extend : optional
+            Used to infer the levels as with the plotting commands. These
+            should also be passed to the plotting commands.
+
+        Other parameters
+        ----------------
+        %(plot.vmin_vmax)s
+        %(plot.levels_manual)s
+        %(plot.levels_auto)s
+
+        Returns
+        -------
+        numpy.ndarray
+            The level edges.
+
+        Example
+        -------
+        >>> import proplot as pplt
+        >>> import numpy as np
+        >>> data = np.random.rand(4, 20, 20)
+        >>> fig, axs = pplt.subplots(ncols=4)
+        >>> levels = axs.levels(data, robust=True)
+        >>> for ax, z in zip(axs, data):
+        ...     ax.contourf(z, levels=levels)
+
+        See also
+        --------
+        proplot.axes.PlotAxes.contourf
+        proplot.axes.PlotAxes.pcolormesh
+        proplot.constructor.Norm
+        proplot.colors.DiscreteNorm
+        """
+        # NOTE: Critical to pass dummy coordinates so _parse_level_lim
+        # interprets every positional argument as sample data.
+        if not self:
+            raise ValueError('Cannot get levels for empty SubplotGrid.')
+        zs = []
+        for z in args:
+            z = inputs._to_numpy_array(z)
+            if z.ndim > 2:  # include views of every 2D slice
+                zs.extend(z[idx] for idx in np.ndindex(z.shape[:-2]))
+            else:
+                zs.append(z)
+        norm_kw = dict(norm_kw or {})
+        levels, *_, kwargs = self[0]._parse_level_vals(
+            None, None, *zs, norm=norm, norm_kw=norm_kw, extend=extend, **kwargs
+        )
+        kwargs.pop('discrete_ticks', None)
+        if kwargs:
+            warnings._warn_proplot(f'Ignoring unused keyword arg(s): {kwargs}')
+        if levels is None:
+            raise ValueError('Failed to determine levels from the input data.')
+        return np.asarray(levels)
+
     @property
     def figure(self):
         """
@@ -4,6 +4,7 @@ Internal utilities.
 """
 # Import statements
 import inspect
+import weakref
 from numbers import Integral, Real
 
 import numpy as np
@@ -46,6 +47,7 @@ def _not_none(*args, default=None, **kwargs):
 # WARNING: Must come after _not_none because this is leveraged inside other funcs
 from . import (  # noqa: F401
     benchmarks,
+    caches,
     context,
     docstring,
     fonts,
@@ -57,6 +59,7 @@ from . import (  # noqa: F401
     warnings
 )
 from .versions import _version_mpl, _version_cartopy  # noqa: F401
+from .versions import _has_module, _is_instance  # noqa: F401
 from .warnings import ProplotWarning  # noqa: F401
 
 
@@ -228,6 +231,22 @@ docstring._snippet_manager['artist.collection_pcolor'] = _pcolor_collection_docs
 docstring._snippet_manager['artist.collection_contour'] = _contour_collection_docstring
 
 
+# Cached lookup tables. Parameter names are cached for the underlying function of
+# methods so that repeatedly creating bound methods does not repeat the inspection.
+# NOTE: Weak references are used so that cached functions can be garbage collected.
+_alias_tables = {}
+_param_names = weakref.WeakKeyDictionary()
+_internal_params = {
+    'default_cmap',
+    'default_discrete',
+    'inbounds',
+    'plot_contours',
+    'plot_lines',
+    'skip_autolev',
+    'to_centers',
+}
+
+
 def _get_aliases(category, *keys):
     """
     Get all available aliases.
@@ -239,6 +258,40 @@ def _get_aliases(category, *keys):
     return tuple(aliases)
 
 
+def _get_alias_table(category, prefix=''):
+    """
+    Return a dictionary that maps the (prefixed) property names and aliases for the
+    category to their position in the alias map and their canonical property name.
+    """
+    table = _alias_tables.get((category, prefix))
+    if table is None:
+        table = {}
+        for idx, (key, aliases) in enumerate(_alias_maps[category].items()):
+            aliases = (aliases,) if isinstance(aliases, str) else aliases
+            for jdx, alias in enumerate((key, *aliases)):
+                table.setdefault(prefix + alias, (idx, jdx, key, alias))
+        _alias_tables[category, prefix] = table
+    return table
+
+
+def _get_params(func):
+    """
+    Return the parameter names for the function, method, or signature.
+    """
+    if isinstance(func, inspect.Signature):
+        return tuple(func.parameters)
+    base = getattr(func, '__func__', func)
+    try:
+        cache = _param_names.setdefault(base, {})
+    except TypeError:  # cannot create weak reference
+        return tuple(inspect.signature(func).parameters)
+    bound = base is not func
+    names = cache.get(bound)
+    if names is None:
+        names = cache[bound] = tuple(inspect.signature(func).parameters)
+    return names
+
+
 def _kwargs_to_args(options, *args, allow_extra=False, **kwargs):
     """
     Translate keyword arguments to positional arguments. Permit omitted
@@ -269,7 +322,7 @@ def _pop_kwargs(kwargs, *keys, **aliases):
     aliases.update({key: () for key in keys})
     for key, aliases in aliases.items():
         aliases = (aliases,) if isinstance(aliases, str) else aliases
-        opts = {key: kwargs.pop(key, None) for key in (key, *aliases)}
+        opts = {name: kwargs.pop(name) for name in (key, *aliases) if name in kwargs}
         value = _not_none(**opts)
         if value is not None:
             output[key] = value
@@ -280,28 +333,17 @@ def _pop_params(kwargs, *funcs, ignore_internal=False):
     """
     Pop parameters of the input functions or methods.
     """
-    internal_params = {
-        'default_cmap',
-        'default_discrete',
-        'inbounds',
-        'plot_contours',
-        'plot_lines',
-        'skip_autolev',
-        'to_centers',
-    }
     output = {}
     for func in funcs:
-        if isinstance(func, inspect.Signature):
-            sig = func
-        elif callable(func):
-            sig = inspect.signature(func)
-        elif func is None:
+        if func is None:
             continue
-        else:
+        elif not isinstance(func, inspect.Signature) and not callable(func):
             raise RuntimeError(f'Internal error. Invalid function {func!r}.')
-        for key in sig.parameters:
-            value = kwargs.pop(key, None)
-            if ignore_internal and key in internal_params:
+        for key in _get_params(func):
+            if key not in kwargs:
+                continue
+            value = kwargs.pop(key)
+            if ignore_internal and key in _internal_params:
                 continue
             if value is not None:
                 output[key] = value
@@ -312,6 +354,9 @@ def _pop_props(input, *categories, prefix=None, ignore=None, skip=None):
     """
     Pop the registered properties and return them in a new dictionary.
     """
+    # NOTE: Here we only iterate over the input keys rather than every alias, then
+    # sort the matches by their position in the alias map so that properties are
+    # returned and conflicting aliases are resolved in the same order as before.
     output = {}
     skip = skip or ()
     ignore = ignore or ()
@@ -321,14 +366,15 @@ def _pop_props(input, *categories, prefix=None, ignore=None, skip=None):
         ignore = (ignore,)
     prefix = prefix or ''  # e.g. 'box' for boxlw, boxlinewidth, etc.
     for category in categories:
-        for key, aliases in _alias_maps[category].items():
-            if isinstance(aliases, str):
-                aliases = (aliases,)
-            opts = {
-                prefix + alias: input.pop(prefix + alias, None)
-                for alias in (key, *aliases)
-                if alias not in skip
-            }
+        table = _get_alias_table(category, prefix)
+        names = sorted(
+            (table[name], name) for name in input
+            if name in table and table[name][3] not in skip
+        )
+        props = {}
+        for (_, _, key, _), name in names:
+            props.setdefault(key, {})[name] = input.pop(name)
+        for key, opts in props.items():
             prop = _not_none(**opts)
             if prop is None:
                 continue
@@ -2,24 +2,77 @@
 """
 Utilities for benchmarking proplot performance.
 """
+# NOTE: Set the environment variable PROPLOT_BENCHMARK to a true-like value
+# before importing proplot to record import times and print them with 'print'.
+# The timings are available with report() as a nested json-serializable dict.
+import os
 import time
 
 from . import ic  # noqa: F401
 
-BENCHMARK = False  # toggle this to turn on benchmarking (see timers.py)
+_mode = os.environ.get('PROPLOT_BENCHMARK', '').lower()
+BENCHMARK = _mode not in ('', '0', 'false', 'no', 'off')
+VERBOSE = _mode == 'print'  # also print timings as they are recorded
+
+# Nested timing records and the stack of active records
+_records = {}
+_stack = []
+
+
+def _new_record():
+    """
+    Return an empty timing record.
+    """
+    return {'time': 0.0, 'count': 0, 'phases': {}}
 
 
 class _benchmark(object):
     """
-    Context object for timing arbitrary blocks of code.
+    Context object for timing arbitrary blocks of code. Blocks can be nested
+    and timings for blocks with the same name and parent are accumulated.
     """
     def __init__(self, message):
         self.message = message
 
     def __enter__(self):
         if BENCHMARK:
+            phases = _stack[-1]['phases'] if _stack else _records
+            self.record = phases.setdefault(self.message, _new_record())
+            _stack.append(self.record)
             self.time = time.perf_counter()
 
     def __exit__(self, *args):  # noqa: U100
         if BENCHMARK:
-            print(f'{self.message}: {time.perf_counter() - self.time}s')
+            elapsed = time.perf_counter() - self.time
+            _stack.pop()
+            self.record['time'] += elapsed
+            self.record['count'] += 1
+            if VERBOSE:
+                print(f'{"  " * len(_stack)}{self.message}: {elapsed}s')
+
+
+def report():
+    """
+    Return a json-serializable dictionary of the recorded timings. Each phase
+    records the total `time` in seconds, the number of times `count` it was
+    entered, and the nested `phases`. Empty if benchmarking is disabled.
+    """
+    def _copy(records):
+        return {
+            name: {
+                'time': record['time'],
+                'count': record['count'],
+                'phases': _copy(record['phases']),
+            }
+            for name, record in records.items()
+        }
+    phases = _copy(_records)
+    total = sum(record['time'] for record in phases.values())
+    return {'enabled': BENCHMARK, 'time': total, 'phases': phases}
+
+
+def reset():
+    """
+    Clear the recorded timings.
+    """
+    _records.clear()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Utilities for memoizing expensive computations.
+"""
+# NOTE: Caches are registered by name so that their statistics can be inspected
+# with info() and their contents removed with clear(). Each cache records the
+# number of `hits` and `misses` and is limited to `maxsize` entries.
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from . import ic  # noqa: F401
+
+# Registered caches
+_caches = {}
+
+
+class _LRUCache(object):
+    """
+    Least-recently-used cache with a size limit and hit and miss statistics.
+    A `maxsize` of zero disables the cache.
+    """
+    def __init__(self, maxsize=128):
+        self.hits = self.misses = 0
+        self._data = OrderedDict()
+        self.maxsize = maxsize
+
+    def __len__(self):
+        return len(self._data)
+
+    @property
+    def maxsize(self):
+        """
+        The maximum number of cached values. Lowering this removes
+        the least recently used values if necessary.
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        self._maxsize = value
+        self._trim()
+
+    def _trim(self):
+        """
+        Remove the least recently used values exceeding the size limit.
+        """
+        while self._data and len(self._data) > max(self._maxsize, 0):
+            self._data.popitem(last=False)
+
+    def get(self, key, default=None):
+        """
+        Return the cached value and mark it as recently used.
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """
+        Cache the value and remove the least recently used values if necessary.
+        """
+        if self.maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self._trim()
+
+    def clear(self):
+        """
+        Remove the cached values and reset the statistics.
+        """
+        self._data.clear()
+        self.hits = self.misses = 0
+
+    def info(self):
+        """
+        Return a dictionary of the cache statistics.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+        }
+
+
+def _get_cache(name, maxsize=128):
+    """
+    Return the registered cache with the given name, creating it if necessary.
+    """
+    if name not in _caches:
+        _caches[name] = _LRUCache(maxsize)
+    return _caches[name]
+
+
+def _array_key(data, samples=1024):
+    """
+    Return a cheap content key for the array or ``None`` if it is unsupported.
+    The key includes the shape, the data type, the units, the sums of the values
+    and mask, the number of non-finite values, and an evenly strided sample of
+    the values and mask.
+    """
+    # NOTE: This requires a couple passes over the data for the sums (cheaper than
+    # e.g. the percentiles used for robust colormap limits) and detects almost all
+    # in-place modifications, unlike keys based on the array identity. The sum
+    # ignores NaNs so that modifications of e.g. land-masked fields are detected.
+    units = getattr(data, 'units', None)
+    data = getattr(data, 'magnitude', data)
+    data = np.asanyarray(data)
+    if data.dtype.kind in 'mM':
+        data = data.view('i8')
+    if data.dtype.kind not in 'biufc':
+        return None
+    mask = np.ma.getmaskarray(data).ravel() if np.ma.isMA(data) else None
+    values = np.ma.getdata(data).ravel()
+    step = max(1, values.size // samples)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(values[::step]).tobytes())
+    with np.errstate(all='ignore'):
+        digest.update(np.asarray(np.nansum(values)).tobytes())
+        if values.dtype.kind in 'fc':
+            digest.update(np.asarray(np.isfinite(values).sum()).tobytes())
+    if mask is not None:
+        digest.update(np.ascontiguousarray(mask[::step]).tobytes())
+        digest.update(np.asarray(mask.sum()).tobytes())
+    return (data.shape, data.dtype.str, str(units), digest.digest())
+
+
+def info(name=None):
+    """
+    Return a dictionary of the cache statistics for the cache `name`
+    or a dictionary of dictionaries for every registered cache.
+    """
+    if name is not None:
+        return _get_cache(name).info()
+    return {key: cache.info() for key, cache in _caches.items()}
+
+
+def clear(name=None):
+    """
+    Clear the cache `name` or every registered cache.
+    """
+    caches = (_get_cache(name),) if name is not None else _caches.values()
+    for cache in caches:
+        cache.clear()
@@ -2,6 +2,7 @@
 """
 Utilities for processing input data passed to plotting commands.
 """
+import contextlib
 import functools
 import sys
 
@@ -11,11 +12,6 @@ import numpy.ma as ma
 from . import ic  # noqa: F401
 from . import _not_none, warnings
 
-try:
-    from cartopy.crs import PlateCarree
-except ModuleNotFoundError:
-    PlateCarree = object
-
 
 # Constants
 BASEMAP_FUNCS = (  # default latlon=True
@@ -30,6 +26,9 @@ CARTOPY_FUNCS = (  # default transform=PlateCarree()
     'quiver', 'scatter', 'streamplot', 'step',
     'tricontour', 'tricontourf', 'tripcolor',  # NOTE: not sure why these work
 )
+DESCENDING_CHUNK = 65536  # number of differences checked at once
+DASK_SAMPLE = 1000000  # number of values used for dask percentile estimates
+DECIMATE_BINSIZE = 1000  # average bin size above which bins are reduced separately
 
 
 def _load_objects():
@@ -41,8 +40,9 @@ def _load_objects():
     # try loading these classes within autoformat calls. This saves >500ms of import
     # time. We use ndarray as the default value for unimported types and in loops we
     # are careful to check membership to np.ndarray before anything else.
-    global ndarray, DataArray, DataFrame, Series, Index, Quantity
+    global ndarray, DataArray, DataFrame, Series, Index, Quantity, DaskArray
     ndarray = np.ndarray
+    DaskArray = getattr(sys.modules.get('dask.array', None), 'Array', ndarray)
     DataArray = getattr(sys.modules.get('xarray', None), 'DataArray', ndarray)
     DataFrame = getattr(sys.modules.get('pandas', None), 'DataFrame', ndarray)
     Series = getattr(sys.modules.get('pandas', None), 'Series', ndarray)
@@ -53,44 +53,155 @@ def _load_objects():
 _load_objects()
 
 
+# Copy accounting
+# NOTE: The number of full-size array copies made while normalizing input data
+# is recorded for each plotting command so that it can be checked in tests.
+# Copies made by nested plotting commands are also added to the outer command.
+_copy_counts = {}
+_copy_stack = []
+
+
+@contextlib.contextmanager
+def _with_copy_count(name):
+    """
+    Record the number of copies made until the context is exited.
+    """
+    _copy_stack.append(0)
+    try:
+        yield
+    finally:
+        count = _copy_stack.pop()
+        _copy_counts[name] = count
+        if _copy_stack:
+            _copy_stack[-1] += count
+
+
+def _add_copy(data, source):
+    """
+    Record a copy if the normalized data does not share memory with the source.
+    """
+    if _copy_stack and np.size(data) > 1 and not np.may_share_memory(data, source):
+        _copy_stack[-1] += 1
+
+
+def copies(name=None):
+    """
+    Return the number of full-size array copies made while normalizing the
+    input data during the most recent call to the plotting command `name`
+    or a dictionary of the numbers for every plotting command.
+    """
+    if name is not None:
+        return _copy_counts.get(name, 0)
+    return dict(_copy_counts)
+
+
 # Type utilities
+# NOTE: These are called several times for the same coordinate arrays during each
+# plotting command (e.g. in _parse_1d_format, _to_edges, and _to_centers) so the
+# results are cached by object identity while a plotting command is running. The
+# cache stores the objects themselves so that their identities cannot be reused.
+_inspect_cache = None
+
+
+@contextlib.contextmanager
+def _with_inspect_cache():
+    """
+    Cache type inspection results until the outermost context is exited.
+    """
+    global _inspect_cache
+    if _inspect_cache is not None:
+        yield
+        return
+    _inspect_cache = {}
+    try:
+        yield
+    finally:
+        _inspect_cache = None
+
+
+def _cache_inspect(func):
+    """
+    Decorate a type inspection function so results are cached
+    by object identity inside `_with_inspect_cache`.
+    """
+    @functools.wraps(func)
+    def _cache_inspect(data):
+        if _inspect_cache is None:
+            return func(data)
+        key = (func.__name__, id(data))
+        if key not in _inspect_cache:
+            _inspect_cache[key] = (data, func(data))
+        return _inspect_cache[key][1]
+
+    return _cache_inspect
+
+
+def _get_types(array):
+    """
+    Return the set of element types for object arrays.
+    """
+    return set(map(type, array.flat))
+
+
+@_cache_inspect
 def _is_numeric(data):
     """
     Test whether input is numeric array rather than datetime or strings.
     """
-    array = _to_numpy_array(data)
+    array = _to_numpy_array(data, strip_units=True)
     return len(data) and (
         np.issubdtype(array.dtype, np.number)
         or np.issubdtype(array.dtype, object)
-        and all(isinstance(_, np.number) for _ in array.flat)
+        and all(issubclass(_, np.number) for _ in _get_types(array))
     )
 
 
+@_cache_inspect
 def _is_categorical(data):
     """
     Test whether input is array of strings.
     """
-    array = _to_numpy_array(data)
+    array = _to_numpy_array(data, strip_units=True)
     return len(data) and (
         np.issubdtype(array.dtype, str)
         or np.issubdtype(array.dtype, object)
-        and any(isinstance(_, str) for _ in array.flat)
+        and any(issubclass(_, str) for _ in _get_types(array))
     )
 
 
+@_cache_inspect
 def _is_descending(data):
     """
     Test whether the input data is descending. This is used for auto axis reversal.
     """
     # NOTE: Want this to work with e.g. datetime object arrays and numpy datetime
-    # arrays so use try except clause.
-    data = _to_numpy_array(data)
+    # arrays so use try except clause. Differences are compared with their absolute
+    # values rather than zero so that timedelta objects are supported, and masked
+    # or invalid differences are not considered descending. Check the differences
+    # in chunks so that e.g. ascending data returns after the first chunk.
+    data = _to_numpy_array(data, strip_units=True)
     if data.ndim > 1 or data.size < 2:
         return False
     try:
-        return all(x != abs(x) for x in np.diff(data))
+        for idx in range(0, data.size - 1, DESCENDING_CHUNK):
+            diff = np.diff(data[idx:idx + DESCENDING_CHUNK + 1])
+            if not np.all(ma.filled(diff != np.abs(diff), False)):
+                return False
     except TypeError:
         return False
+    return True
+
+
+def _is_dask(data):
+    """
+    Test whether input is a dask array or a dask-backed `DataArray`.
+    """
+    _load_objects()
+    if DaskArray is ndarray:
+        return False
+    if DataArray is not ndarray and isinstance(data, DataArray):
+        data = data.data
+    return isinstance(data, DaskArray)
 
 
 def _to_duck_array(data, strip_units=False):
@@ -133,6 +244,8 @@ def _to_numpy_array(data, strip_units=False):
     if Quantity is not ndarray and isinstance(data, Quantity):
         if strip_units:
             return np.atleast_1d(data.magnitude)
+        elif isinstance(data.magnitude, ndarray) and data.magnitude.ndim:
+            return data  # avoid copying the magnitude
         else:
             return np.atleast_1d(data.magnitude) * data.units
     else:
@@ -161,6 +274,271 @@ def _to_masked_array(data, *, copy=False):
     return data, units
 
 
+def _to_filled_array(data, *, copy=False):
+    """
+    Convert numpy array to unmasked array with invalid values replaced by the
+    masked array fill value. Return the array, the fill value, and the units.
+    If `copy` is ``True`` the result is guaranteed not to share memory with the
+    input, but otherwise the input data is copied only if necessary.
+    """
+    # NOTE: This avoids computing an invalid mask for floating point data where
+    # invalid values are already NaN. Other data is filled using masked arrays,
+    # which copies the data only if some values are masked or invalid.
+    units = None
+    data = _to_numpy_array(data)
+    if ndarray is not Quantity and isinstance(data, Quantity):
+        data, units = data.magnitude, data.units
+    source = data
+    if data.dtype.kind in 'fc' and not ma.isMA(data):
+        nan = data.dtype.type(np.nan)
+        with np.errstate(all='ignore'):
+            infinite = not np.isfinite(np.sum(data)) and np.isinf(data)
+        if np.any(infinite):
+            data = data.copy()
+            data[infinite] = nan
+    else:
+        data, _ = _to_masked_array(data)
+        nan = data.fill_value
+        data = data.filled()
+    if copy and np.may_share_memory(data, source):
+        data = data.copy()
+    _add_copy(data, source)
+    return data, nan, units
+
+
+# Coarsening utilities
+def _nanmean(data, axis=None):
+    """
+    Return the average of valid values without warnings for empty slices.
+    """
+    valid = ~np.isnan(data)
+    with np.errstate(all='ignore'):
+        return np.sum(np.where(valid, data, 0), axis=axis) / np.sum(valid, axis=axis)
+
+
+def _nanmax(data, axis=None):
+    """
+    Return the maximum of valid values without warnings for empty slices.
+    """
+    return np.fmax.reduce(data, axis=axis)
+
+
+def _coarsen_steps(size, shape):
+    """
+    Return the block sizes used to coarsen data with the input size
+    so that it has approximately the input shape.
+    """
+    return tuple(max(1, int(n // max(1, m))) for n, m in zip(size, shape))
+
+
+def _coarsen_index(size, step, edges=False, trim=True):
+    """
+    Return the indices of the block centers or block edges along a dimension
+    with the input size coarsened with the input block size. If `trim` is
+    ``False`` then excess values are kept as a partial block.
+    """
+    stop = size - size % step if trim else size
+    starts = np.arange(0, stop, step)
+    if edges:
+        return np.append(starts, stop)
+    return starts + (np.minimum(starts + step, stop) - starts) // 2
+
+
+def _coarsen_coords(x, y, size, steps, trim=True):
+    """
+    Sample the coordinates at the block centers or block edges for data with the
+    input size coarsened with the input block sizes. Return ``None`` if the
+    coordinates do not match the data centers or edges.
+    """
+    # NOTE: Coordinates are sampled rather than averaged so that this works with
+    # datetime coordinates and curvilinear 2D coordinates.
+    def _coarsen(coords, dims):
+        if coords is None:
+            return None
+        index = []
+        for n, dim in zip(coords.shape, dims):
+            if n not in (size[dim], size[dim] + 1):
+                raise ValueError('Coordinates do not match data.')
+            edges = n == size[dim] + 1
+            index.append(_coarsen_index(size[dim], steps[dim], edges, trim))
+        return coords[index[0]] if len(index) == 1 else coords[np.ix_(*index)]
+    try:
+        x = _coarsen(x, (1,) if x is None or x.ndim == 1 else (0, 1))
+        y = _coarsen(y, (0,) if y is None or y.ndim == 1 else (0, 1))
+    except ValueError:
+        return None
+    return x, y
+
+
+def _coarsen_data(data, steps, method='mean'):
+    """
+    Return the data averaged (``'mean'``), maximized (``'max'``), or sampled
+    (``'nearest'``) over blocks along the first two dimensions.
+    """
+    sy, sx = steps
+    ny, nx = (n - n % step for n, step in zip(data.shape, steps))
+    if method == 'nearest':
+        return data[sy // 2:ny:sy, sx // 2:nx:sx]
+    dtype = data.dtype
+    data, *_ = _to_filled_array(data)
+    data = data[:ny, :nx].reshape((ny // sy, sy, nx // sx, sx, *data.shape[2:]))
+    if method == 'max':
+        data = _nanmax(data, axis=(1, 3))
+    else:
+        data = _nanmean(data, axis=(1, 3))
+    if data.ndim > 2 and dtype.kind in 'ui':  # preserve image color values
+        data = np.round(data).astype(dtype)
+    return data
+
+
+def _decimate_index(x, y, lo, hi, width, offset=0):
+    """
+    Return the indices of the first, last, minimum, maximum, and first invalid
+    points in each unit-width bin along ascending coordinates `x` after mapping
+    `lo` and `hi` to ``offset`` and ``offset + width`` (i.e., the "M4" algorithm).
+    The points just outside of the bins are also included so that lines are
+    drawn to the edges.
+    """
+    # NOTE: This preserves the pixels covered by aliased lines with one bin per
+    # pixel column. Invalid points are kept so that gaps in lines are preserved.
+    # NOTE: Since coordinates are sorted we find the bin bounds by searching for the
+    # bin edges. With large bins we then reduce each bin separately rather than
+    # using vectorized reductions that require several full-size temporary arrays.
+    i0 = max(np.searchsorted(x, lo, side='left') - 1, 0)
+    i1 = min(np.searchsorted(x, hi, side='right') + 1, x.size)
+    n = int(np.ceil(width + offset))
+    if i1 - i0 <= 4 * n:
+        return np.arange(i0, i1)
+    x, y = x[i0:i1], y[i0:i1]
+    edges = lo + (np.arange(n + 1) - offset) * ((hi - lo) / width)
+    bounds = np.unique(np.concatenate(([0, x.size], np.searchsorted(x, edges))))
+    starts, stops = bounds[:-1], bounds[1:]
+    if x.size > DECIMATE_BINSIZE * starts.size:
+        keep = [starts, stops - 1]
+        for start, stop in zip(starts, stops):
+            values = y[start:stop]
+            imin, imax = values.argmin(), values.argmax()
+            if np.isnan(values[imin]):  # first invalid point
+                keep.append([start + imin])
+                mask = np.isnan(values)
+                if mask.all():
+                    continue
+                imin = np.where(mask, np.inf, values).argmin()
+                imax = np.where(mask, -np.inf, values).argmax()
+            keep.append([start + imin, start + imax])
+        return np.unique(np.concatenate(keep)) + i0
+    counts = stops - starts
+    index, size = np.arange(x.size), x.size
+    invalid = np.isnan(y)
+    keep = [starts, stops - 1]
+    keep.append(np.minimum.reduceat(np.where(invalid, index, size), starts))
+    for ufunc in (np.fmin, np.fmax):
+        values = np.repeat(ufunc.reduceat(y, starts), counts)
+        keep.append(np.minimum.reduceat(np.where(y == values, index, size), starts))
+    keep = np.concatenate(keep)
+    return np.unique(keep[keep < size]) + i0
+
+
+# Dask utilities
+# NOTE: Plotting commands should never compute the full dask arrays. Ranges are
+# computed with chunked reductions and 2D data can be reduced over blocks of values
+# in the same display pixel, then computed once along with the full range.
+def _dask_range(data, lo=0, hi=100, sample=None):
+    """
+    Return the minimum and maximum using chunked reductions or the percentile
+    range estimated from an evenly spaced sample of the dask array.
+    """
+    import dask
+    import dask.array as da
+    if DataArray is not ndarray and isinstance(data, DataArray):
+        data = data.data
+    data = data.ravel()
+    if lo > 0 or hi < 100:
+        sample = min(data.size, sample or DASK_SAMPLE)
+        index = np.linspace(0, data.size - 1, sample).astype(int)
+        return _safe_range(data[index].compute(), lo, hi)
+    values = dask.compute(da.nanmin(data), da.nanmax(data))
+    return _safe_range(np.array(values))
+
+
+def _dask_coarsen(x, y, z, shape, method='mean'):
+    """
+    Return the coordinates and data for the dask array or dask-backed `DataArray`
+    averaged (``'mean'``), maximized (``'max'``), or sampled (``'nearest'``) over
+    blocks so that the data has approximately the input shape. Also return the
+    minimum and maximum of the full-resolution data.
+    """
+    # NOTE: Coordinates are sampled at the block centers or block edges rather than
+    # averaged so that this works with datetime coordinates. Give up and compute
+    # the full array if the coordinates do not match the data centers or edges.
+    # NOTE: Excess values are kept as partial blocks by padding with NaN. Integer
+    # and boolean data are always sampled since averages would be invalid values.
+    import dask
+    import dask.array as da
+    xarray = DataArray is not ndarray and isinstance(z, DataArray)
+    data = z.data if xarray else z
+    if data.ndim != 2 or data.dtype.kind not in 'biuf':
+        return x, y, z.compute(), None
+    steps = _coarsen_steps(data.shape, shape)
+    if not xarray and x is None and y is None:
+        y, x = np.arange(data.shape[0]), np.arange(data.shape[1])
+    coarse = data
+    if any(step > 1 for step in steps):
+        xy = _coarsen_coords(x, y, data.shape, steps, trim=False)
+        if xy is None:
+            return x, y, z.compute(), None
+        x, y = xy
+        index = [
+            _coarsen_index(n, step, trim=False)
+            for n, step in zip(data.shape, steps)
+        ]
+        if method == 'nearest' or data.dtype.kind != 'f':
+            coarse = data[index[0], :][:, index[1]]
+        else:
+            pad = [(0, -n % step) for n, step in zip(data.shape, steps)]
+            coarse = da.pad(data, pad, mode='constant', constant_values=np.nan)
+            func = _nanmax if method == 'max' else _nanmean
+            coarse = da.coarsen(func, coarse, dict(enumerate(steps)))
+        if xarray:
+            z = z.isel(dict(zip(z.dims, index)))
+    coarse, *values = dask.compute(coarse, da.nanmin(data), da.nanmax(data))
+    z = z.copy(data=coarse) if xarray else coarse
+    return x, y, z, _safe_range(np.array(values))
+
+
+# NOTE: The full-resolution ranges of coarsened data are stored by object identity
+# while a plotting command is running so that _safe_range() can use them for the
+# automatic colormap normalization range. This is separate from the inspection
+# cache since it stores plotting command state rather than memoized results.
+_range_cache = None
+
+
+@contextlib.contextmanager
+def _with_range_cache():
+    """
+    Store ranges passed to `_cache_range` until the outermost context is exited.
+    """
+    global _range_cache
+    if _range_cache is not None:
+        yield
+        return
+    _range_cache = {}
+    try:
+        yield
+    finally:
+        _range_cache = None
+
+
+def _cache_range(data, range_, source=None):
+    """
+    Cache the minimum and maximum for the array while a plotting command
+    is running. This is used for data coarsened with `_dask_coarsen`. If
+    `source` is passed then percentile ranges are estimated from it instead.
+    """
+    if _range_cache is not None:
+        _range_cache[id(data)] = (data, range_, source)
+
+
 # Input data transformations
 def _to_edges(x, y, z):
     """
@@ -263,6 +641,7 @@ def _preprocess_or_redirect(*keys, keywords=None, allow_extra=True):
                         kwargs['latlon'] = True
                 if self._name == 'cartopy' and name in CARTOPY_FUNCS:
                     if kwargs.get('transform', None) is None:
+                        from cartopy.crs import PlateCarree  # imported by axes
                         kwargs['transform'] = PlateCarree()
                     else:
                         kwargs['transform'] = Proj(kwargs['transform'])
@@ -289,7 +668,8 @@ def _preprocess_or_redirect(*keys, keywords=None, allow_extra=True):
                             ureg.setup_matplotlib(True)
 
                 # Call main function
-                return func(self, *args, **kwargs)  # call unbound method
+                with _with_inspect_cache(), _with_range_cache(), _with_copy_count(name):  # noqa: E501
+                    return func(self, *args, **kwargs)  # call unbound method
 
         return _preprocess_or_redirect
 
@@ -327,8 +707,7 @@ def _dist_reduce(data, *, mean=None, means=None, median=None, medians=None, **kw
         )
         medians = None
     if means or medians:
-        distribution, units = _to_masked_array(data)
-        distribution = distribution.filled()
+        distribution, _, units = _to_filled_array(data)
         if distribution.ndim != 2:
             raise ValueError(
                 f'Expected 2D array for means=True. Got {distribution.ndim}D.'
@@ -468,9 +847,7 @@ def _safe_mask(mask, *args):
     invalid = ~mask  # True if invalid
     args_masked = []
     for data in args:
-        data, units = _to_masked_array(data, copy=True)
-        nan = data.fill_value
-        data = data.filled()
+        data, nan, units = _to_filled_array(data, copy=True)
         if data.size > 1 and data.shape != invalid.shape:
             raise ValueError(
                 f'Mask shape {mask.shape} incompatible with array shape {data.shape}.'
@@ -487,41 +864,64 @@ def _safe_mask(mask, *args):
     return args_masked[0] if len(args_masked) == 1 else args_masked
 
 
-def _safe_range(data, lo=0, hi=100):
+def _safe_range(data, lo=0, hi=100, sample=None):
     """
     Safely return the minimum and maximum (default) or percentile range accounting
     for masked values. Use min and max functions when possible for speed. Return
-    ``None`` if we fail to get a valid range.
+    ``None`` if we fail to get a valid range. If `sample` is passed then percentiles
+    of arrays with more valid values are estimated from an evenly spaced sample.
     """
+    # NOTE: Avoid the masked array copy when numeric data is all finite and compute
+    # both percentiles with a single partition. Masked arrays and non-numeric data
+    # (e.g. datetimes) are filtered with np.ma as before.
     _load_objects()
-    data, units = _to_masked_array(data)
-    data = data.compressed()  # remove all invalid values
-    min_ = max_ = None
-    if data.size:
-        min_ = np.min(data) if lo <= 0 else np.percentile(data, lo)
-        if hasattr(min_, 'dtype') and np.issubdtype(min_.dtype, np.integer):
-            min_ = np.float64(min_)
-        try:
-            is_finite = np.isfinite(min_)
-        except TypeError:
-            is_finite = True
-        if not is_finite:
-            min_ = None
-        elif units is not None:
-            min_ *= units
-    if data.size:
-        max_ = np.max(data) if hi >= 100 else np.percentile(data, hi)
-        if hasattr(max_, 'dtype') and np.issubdtype(max_.dtype, np.integer):
-            max_ = np.float64(max_)
+    if _range_cache and id(data) in _range_cache:
+        _, range_, source = _range_cache[id(data)]
+        if lo == 0 and hi == 100:
+            return range_
+        if source is not None:  # percentiles of the full-resolution data
+            data = source
+    if _is_dask(data):
+        return _dask_range(data, lo, hi, sample)
+    units = None
+    data = _to_numpy_array(data)
+    if ndarray is not Quantity and isinstance(data, Quantity):
+        data, units = data.magnitude, data.units
+    if isinstance(data, ma.MaskedArray) or not np.issubdtype(data.dtype, np.number):
+        data, _ = _to_masked_array(data)
+        data = data.compressed()  # remove all invalid values
+    elif np.issubdtype(data.dtype, np.inexact):
+        finite = np.isfinite(data)
+        data = data.ravel() if finite.all() else data[finite]
+    else:
+        data = data.ravel()  # integers cannot be invalid
+    if not data.size:
+        return None, None
+
+    # Get percentiles with a single partition and minima and maxima otherwise
+    qs = [q for q, percentile in ((lo, lo > 0), (hi, hi < 100)) if percentile]
+    values = data
+    if qs and sample and data.size > sample:
+        # NOTE: Use evenly spaced flat indices rather than a fixed stride so that
+        # the sample does not alias with the row length of 2D data.
+        values = data[np.linspace(0, data.size - 1, sample).astype(int)]
+    qs = iter(np.percentile(values, qs) if qs else ())
+    min_ = next(qs) if lo > 0 else np.min(data)
+    max_ = next(qs) if hi < 100 else np.max(data)
+    range_ = []
+    for value in (min_, max_):
+        if hasattr(value, 'dtype') and np.issubdtype(value.dtype, np.integer):
+            value = np.float64(value)
         try:
-            is_finite = np.isfinite(min_)
+            is_finite = np.isfinite(value)
         except TypeError:
             is_finite = True
         if not is_finite:
-            max_ = None
+            value = None
         elif units is not None:
-            max_ *= units
-    return min_, max_
+            value *= units
+        range_.append(value)
+    return tuple(range_)
 
 
 # Metadata utilities
@@ -682,10 +1082,15 @@ def _geo_basemap_2d(x, y, *zs, xmin=-180, xmax=180, globe=False):
     x_orig, y_orig, zs_orig, zs = x, y, zs, []
     for z_orig in zs_orig:
         x, y, z = x_orig, y_orig, z_orig
-        x, z = _geo_inbounds(x, z, xmin=xmin, xmax=xmax)
         if globe and z is not None and x.ndim == 1 and y.ndim == 1:
-            x, y, z = _geo_globe(x, y, z, xmin=xmin, modulo=False)
+            x, y, z = _geo_globe(x, y, z, xmin=xmin, xmax=xmax, modulo=False)
+        else:
+            x, z = _geo_inbounds(x, z, xmin=xmin, xmax=xmax)
         zs.append(z)
+    # WARNING: Basemap requires 2D coordinates. Since basemap copies them when
+    # projecting them we can return broadcasted views of the 1D coordinates here.
+    if x.ndim == 1 and y.ndim == 1:
+        x, y = np.meshgrid(x, y, copy=False)
     return (x, y, *zs)
 
 
@@ -721,75 +1126,129 @@ def _geo_clip(*ys):
     return ys[0] if len(ys) == 1 else ys
 
 
+def _geo_roll(x, xmin=-180):
+    """
+    Return the longitudes rolled so that points on the right edge extending more
+    than 360 above the minimum longitude are on the left side, and the roll size.
+    """
+    lonroll, = np.where(x > xmin + 360)
+    if not lonroll.size:
+        return x, 0
+    roll = x.size - lonroll.min()
+    x = np.roll(x, roll)
+    x[:roll] -= 360  # make monotonic
+    return x, roll
+
+
+def _geo_mask(x, y, xmin=-180, xmax=180):
+    """
+    Return a mask for the data columns outside of the minimum and maximum
+    longitudes or ``None`` if every column is in bounds.
+    """
+    if not y.shape:
+        mask = None
+    elif x.size - 1 == y.shape[-1]:  # test western/eastern grid cell edges
+        mask = (x[1:] < xmin) | (x[:-1] > xmax)
+    elif x.size == y.shape[-1]:  # test the centers and pad by one for safety
+        where, = np.where((x < xmin) | (x > xmax))
+        mask = np.zeros(x.size, dtype=bool)
+        mask[where[1:-1]] = True
+    else:
+        mask = None
+    return mask if mask is not None and mask.any() else None
+
+
 def _geo_inbounds(x, y, xmin=-180, xmax=180):
     """
     Fix conflicts with map coordinates by rolling the data to fall between the
     minimum and maximum longitudes and masking out-of-bounds data points.
     """
-    # Roll in same direction if some points on right-edge extend
-    # more than 360 above min longitude; *they* should be on left side
-    if x.ndim != 1:
-        return x, y
-    lonroll = np.where(x > xmin + 360)[0]  # tuple of ids
-    if lonroll.size:  # non-empty
-        roll = x.size - lonroll.min()
-        x = np.roll(x, roll)
-        y = np.roll(y, roll, axis=-1)
-        x[:roll] -= 360  # make monotonic
     # Set NaN where data not in range xmin, xmax. Must be done for regional smaller
     # projections or get weird side-effects from valid data outside boundaries
-    y, units = _to_masked_array(y)
-    nan = y.fill_value
-    y = y.filled()
-    if not y.shape:
-        pass
-    elif x.size - 1 == y.shape[-1]:  # test western/eastern grid cell edges
-        mask = (x[1:] < xmin) | (x[:-1] > xmax)
+    # NOTE: Copy the data only if values are set to NaN and it is not rolled.
+    if x.ndim != 1:
+        return x, y
+    x, roll = _geo_roll(x, xmin=xmin)
+    y = _to_numpy_array(y)
+    mask = _geo_mask(x, y, xmin=xmin, xmax=xmax)
+    y, nan, _ = _to_filled_array(y, copy=mask is not None and not roll)
+    if roll:
+        source, y = y, np.roll(y, roll, axis=-1)
+        _add_copy(y, source)
+    if mask is not None:
         y[..., mask] = nan
-    elif x.size == y.shape[-1]:  # test the centers and pad by one for safety
-        where, = np.where((x < xmin) | (x > xmax))
-        y[..., where[1:-1]] = nan
     return x, y
 
 
-def _geo_globe(x, y, z, xmin=-180, modulo=False):
+def _geo_globe(x, y, z, xmin=-180, xmax=None, modulo=False):
     """
     Ensure global coverage by fixing gaps over poles and across
-    longitude seams. Increases the size of the arrays.
+    longitude seams. Increases the size of the arrays. If `xmax` is
+    passed the data are also rolled and masked as in `_geo_inbounds`.
     """
-    # Cover gaps over poles by appending polar data
-    with np.errstate(all='ignore'):
-        p1 = np.mean(z[0, :])  # do not ignore NaN if present
-        p2 = np.mean(z[-1, :])
-    ps = (-90, 90) if (y[0] < y[-1]) else (90, -90)
-    z1 = np.repeat(p1, z.shape[1])
-    z2 = np.repeat(p2, z.shape[1])
-    y = ma.concatenate((ps[:1], y, ps[1:]))
-    z = ma.concatenate((z1[None, :], z, z2[None, :]), axis=0)
+    # NOTE: Here the rolled and masked data, the polar data, and the seam data are
+    # written into a single output array rather than concatenated to copies of the
+    # full array. Masked arrays are preserved unless the data are also masked.
+    roll, mask = 0, None
+    z = _to_numpy_array(z)
+    if xmax is not None:
+        x, roll = _geo_roll(x, xmin=xmin)
+        mask = _geo_mask(x, z, xmin=xmin, xmax=xmax)
+        z, nan, _ = _to_filled_array(z)
+    if z.ndim != 2:
+        raise ValueError('Unexpected shapes of coordinates or data arrays.')
     # Cover gaps over cartopy longitude seam
     # Ensure coordinates span 360 after modulus
+    nx = z.shape[1]
+    seam = None  # the seam column position(s)
     if modulo:
         if x[0] % 360 != (x[-1] + 360) % 360:
-            x = ma.concatenate((x, (x[0] + 360,)))
-            z = ma.concatenate((z, z[:, :1]), axis=1)
+            x = np.append(x, x[0] + 360)
+            seam = 'right'
     # Cover gaps over basemap longitude seam
     # Ensure coordinates span exactly 360
     else:
         # Interpolate coordinate centers to seam. Size possibly augmented by 2
-        if x.size == z.shape[1]:
+        if x.size == nx:
             if x[0] + 360 != x[-1]:
                 xi = np.array([x[-1], x[0] + 360])  # input coordinates
                 xq = xmin + 360  # query coordinate
-                zq = ma.concatenate((z[:, -1:], z[:, :1]), axis=1)
-                zq = (zq[:, :1] * (xi[1] - xq) + zq[:, 1:] * (xq - xi[0])) / (xi[1] - xi[0])  # noqa: E501
-                x = ma.concatenate(((xmin,), x, (xmin + 360,)))
-                z = ma.concatenate((zq, z, zq), axis=1)
+                x = np.concatenate(((xmin,), x, (xmin + 360,)))
+                seam = 'both'
         # Extend coordinate edges to seam. Size possibly augmented by 1.
-        elif x.size - 1 == z.shape[1]:
+        elif x.size - 1 == nx:
             if x[0] != xmin:
-                x = ma.append(xmin, x)
+                x = np.append(xmin, x)
                 x[-1] = xmin + 360
-                z = ma.concatenate((z[:, -1:], z), axis=1)
+                seam = 'left'
         else:
             raise ValueError('Unexpected shapes of coordinates or data arrays.')
-    return x, y, z
+    # Write the interior data
+    offset = int(seam in ('left', 'both'))
+    shape = (z.shape[0] + 2, nx + offset + int(seam in ('right', 'both')))
+    dtype = z.dtype if z.dtype.kind in 'fc' else np.dtype(np.float64)
+    out = np.empty(shape, dtype=dtype)
+    if ma.isMA(z):
+        out = ma.array(out, mask=False)
+    inner = out[1:-1, offset:offset + nx]
+    inner[:, :roll] = z[:, nx - roll:]  # roll by writing two slices
+    inner[:, roll:] = z[:, :nx - roll]
+    if mask is not None:
+        inner[:, mask] = nan
+    # Write the seam columns
+    if seam == 'right':
+        out[1:-1, -1] = inner[:, 0]
+    elif seam == 'left':
+        out[1:-1, 0] = inner[:, -1]
+    elif seam == 'both':
+        zq = inner[:, -1] * (xi[1] - xq) + inner[:, 0] * (xq - xi[0])
+        zq /= xi[1] - xi[0]
+        out[1:-1, 0] = out[1:-1, -1] = zq
+    # Cover gaps over poles by writing polar data
+    with np.errstate(all='ignore'):
+        out[0, :] = np.mean(inner[0, :])  # do not ignore NaN if present
+        out[-1, :] = np.mean(inner[-1, :])
+    ps = (-90, 90) if (y[0] < y[-1]) else (90, -90)
+    y = np.concatenate((ps[:1], y, ps[1:]))
+    _add_copy(out, z)
+    return x, y, out
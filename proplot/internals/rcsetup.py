@@ -339,6 +339,19 @@ def _validate_labels(labels, lon=True):
     return array
 
 
+def _validate_minimum(validator, minimum):
+    """
+    Validate the input using the validator and ensure it is not less than the minimum.
+    """
+    def _validate_minimum(value):
+        value = validator(value)
+        if value < minimum:
+            raise ValueError(f'Value must be at least {minimum}. Got {value!r}.')
+        return value
+    _validate_minimum.__name__ = validator.__name__ + '_minimum'
+    return _validate_minimum
+
+
 def _validate_or_none(validator):
     """
     Allow none otherwise pass to the input validator.
@@ -538,6 +551,7 @@ _validate_em = _validate_units('em')
 _validate_in = _validate_units('in')
 _validate_bool = msetup.validate_bool
 _validate_int = msetup.validate_int
+_validate_count = _validate_minimum(_validate_int, 0)
 _validate_float = msetup.validate_float
 _validate_string = msetup.validate_string
 _validate_fontname = msetup.validate_stringlist  # same as 'font.family'
@@ -1110,6 +1124,16 @@ _rc_proplot_table = {
         'Default number of `~proplot.colors.DiscreteNorm` levels for plotting '
         'commands that use colormaps.'
     ),
+    'cmap.levelcache': (
+        0,
+        _validate_count,
+        'Maximum number of automatic colormap `vmin` and `vmax` percentile ranges '
+        'to cache for repeated plotting commands with the same data and settings. '
+        'This only helps commands that use `robust`, since the minimum and maximum '
+        'are about as fast to compute as the content key that identifies the data. '
+        "Statistics are available with ``proplot.internals.caches.info('levels')``. "
+        'Zero disables the cache.'
+    ),
     'cmap.listedthresh': (
         64,
         _validate_int,
@@ -1130,6 +1154,13 @@ _rc_proplot_table = {
         'If ``True``, the default colormap `vmin` and `vmax` are chosen using the '
         '2nd to 98th percentiles rather than the minimum and maximum.'
     ),
+    'cmap.robust_sample': (
+        None,
+        _validate_or_none(_validate_minimum(_validate_int, 1)),
+        'If not ``None``, the percentiles used for "robust" colormap `vmin` and `vmax` '
+        'are estimated from an evenly spaced sample of this many values for larger '
+        'arrays. This is much faster for very large arrays but is approximate.'
+    ),
     'cmap.sequential': (
         CMAPSEQ,
         _validate_cmap('continuous'),
@@ -1232,6 +1263,16 @@ _rc_proplot_table = {
         "global. If ``'auto'``, the extent is automatically adjusted based on "
         "plotted content. Default is ``'globe'``."
     ),
+    'geo.featurecache': (
+        16,
+        _validate_count,
+        'Maximum number of cartopy `~proplot.axes.GeoAxes` geographic feature '
+        'geometry sets to cache. The source geometries are cached for each feature '
+        'and the projected geometries are cached for each feature and projection, '
+        'then shared by subplots with identical projections. Statistics are '
+        'available with '
+        "``proplot.internals.caches.info('features')``. Zero disables the cache."
+    ),
     'geo.round': (
         True,
         _validate_bool,
@@ -1548,6 +1589,24 @@ _rc_proplot_table = {
         'See also :rcraw:`negcolor`.'
     ),
 
+    # Plotting command data reduction
+    'plot.decimate': (
+        False,
+        _validate_bool,
+        'Whether to draw long lines using only the first, last, minimum, and maximum '
+        'points within each pixel for the current axis limits. This has almost no '
+        'visual effect. See also the `decimate` keyword.'
+    ),
+    'plot.downsample': (
+        False,
+        _validate_belongs(False, True, 'mean', 'max', 'nearest'),
+        'Whether to reduce 2D data with more values than display pixels in each '
+        'dimension before plotting with commands like '
+        "`~proplot.axes.PlotAxes.pcolormesh`. If ``True`` or ``'mean'`` the values "
+        "in each pixel are averaged, if ``'max'`` the maximum is used, and if "
+        "``'nearest'`` the central value is used. See also the `downsample` keyword."
+    ),
+
     # Ocean patches
     'ocean': (
         False,
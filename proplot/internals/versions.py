@@ -2,6 +2,11 @@
 """
 Utilities for handling dependencies and version changes.
 """
+import copyreg
+import functools
+import importlib.util
+import sys
+
 from . import ic  # noqa: F401
 from . import warnings
 
@@ -46,14 +51,109 @@ class _version(list):
         return super().__le__(_version(other))
 
 
+@functools.lru_cache()
+def _has_module(name):
+    """
+    Return whether the module is available without importing it.
+    """
+    # NOTE: This is used to defer expensive cartopy and basemap imports until
+    # a geographic axes is requested. Modules already imported are always found.
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):  # e.g. parent package is missing
+        return False
+
+
+def _is_instance(obj, module, name):
+    """
+    Return whether the object is an instance of the class `name` from `module`
+    without importing the module. Instances cannot exist before the import.
+    """
+    cls = getattr(sys.modules.get(module), name, None)
+    return isinstance(cls, type) and isinstance(obj, cls)
+
+
+def _get_version(name):
+    """
+    Return the version of the distribution without importing the package.
+    """
+    if name in sys.modules:
+        return getattr(sys.modules[name], '__version__', '0.0.0')
+    try:
+        from importlib import metadata
+        return metadata.version(name)
+    except ImportError:  # python < 3.8
+        pass
+    except Exception:
+        return '0.0.0'
+    try:
+        import pkg_resources as pkg
+        return pkg.get_distribution(name).version
+    except Exception:
+        return '0.0.0'
+
+
+def _new_deferred(cls, *args):
+    """
+    Create an instance of a class with deferred bases when unpickling.
+    """
+    return cls.__new__(cls, *args)
+
+
+class _DeferredBases(object):
+    """
+    Mixin class that appends base classes from optional dependencies on first
+    instantiation. This lets us define subclasses of e.g. cartopy classes without
+    importing cartopy until they are used. Subclasses should implement the class
+    method ``_load_bases`` that imports the dependency and returns the tuple of
+    base classes and a dictionary of class attributes.
+    """
+    # NOTE: The dynamic class has the same name, module, and qualified name as the
+    # original. Instances are pickled and copied as instances of the original class
+    # and __new__ redirects back to the dynamic class when they are restored.
+    _deferred_origin = None
+
+    def __new__(cls, *args, **kwargs):  # noqa: U100
+        return super().__new__(cls._get_deferred())
+
+    def __reduce_ex__(self, protocol):
+        func, args, *state = super().__reduce_ex__(protocol)
+        if func is copyreg.__newobj__ and self._deferred_origin is not None:
+            func, args = _new_deferred, (self._deferred_origin, *args[1:])
+        return (func, args, *state)
+
+    @classmethod
+    def _load_bases(cls):
+        return (), {}
+
+    @classmethod
+    def _get_deferred(cls):
+        """
+        Return the class with the deferred base classes appended.
+        """
+        if cls._deferred_origin is not None:
+            return cls
+        deferred = cls.__dict__.get('_deferred_class', None)
+        if deferred is None:
+            bases, attrs = cls._load_bases()
+            attrs = {
+                '__module__': cls.__module__,
+                '__qualname__': cls.__qualname__,
+                '__doc__': cls.__doc__,
+                '_deferred_origin': cls,
+                **attrs,
+            }
+            deferred = type(cls.__name__, (cls, *bases), attrs)
+            cls._deferred_class = deferred
+        return deferred
+
+
 # Matplotlib version
 import matplotlib  # isort:skip
 _version_mpl = _version(matplotlib.__version__)
 
 # Cartopy version
-try:
-    import cartopy
-except ImportError:
-    _version_cartopy = _version('0.0.0')
-else:
-    _version_cartopy = _version(cartopy.__version__)
+# NOTE: Avoid importing cartopy here since it is slow. See _get_version.
+_version_cartopy = _version(_get_version('cartopy'))
@@ -817,39 +817,40 @@ class CutoffTransform(mtransforms.Transform):
             raise ValueError('Final scale must be finite.')
         if any(dists < 0):
             raise ValueError('Thresholds must be monotonically increasing.')
-        if any((dists == 0) | (scales == 0)):
+        if any((dists == 0) | (scales[:-1] == 0)):
             if zero_dists is None:
                 raise ValueError('Keyword zero_dists is required for discrete steps.')
-            if any((dists == 0) != (scales == 0)):
+            if any((dists == 0) != (scales[:-1] == 0)):
                 raise ValueError('Input scales disagree with discrete step locations.')
         self._scales = scales
         self._threshs = threshs
         with np.errstate(divide='ignore', invalid='ignore'):
             dists = np.concatenate((threshs[:1], dists / scales[:-1]))
             if zero_dists is not None:
-                dists[scales[:-1] == 0] = zero_dists
+                dists[1:][scales[:-1] == 0] = zero_dists
             self._dists = dists
+            self._cumdists = np.cumsum(dists)  # thresholds in transformed space
 
     def inverted(self):
         # Use same algorithm for inversion!
-        threshs = np.cumsum(self._dists)  # thresholds in transformed space
+        threshs = self._cumdists
         with np.errstate(divide='ignore', invalid='ignore'):
             scales = 1.0 / self._scales  # new scales are inverse
         zero_dists = np.diff(self._threshs)[scales[:-1] == 0]
         return CutoffTransform(threshs, scales, zero_dists=zero_dists)
 
     def transform_non_affine(self, a):
-        # Cannot do list comprehension because this method sometimes
-        # received non-1D arrays
-        dists = self._dists
-        scales = self._scales
-        threshs = self._threshs
-        aa = np.array(a)  # copy
+        # NOTE: Evaluate the piecewise linear function for every value at once using
+        # the cumulative transformed distances. Values below the first threshold
+        # are unchanged. This method sometimes receives non-1D arrays.
+        aa = np.array(a, dtype=float)  # copy
+        j = np.searchsorted(self._threshs, aa)
+        mask = j > 0
+        j = j[mask] - 1
         with np.errstate(divide='ignore', invalid='ignore'):
-            for i, ai in np.ndenumerate(a):
-                j = np.searchsorted(threshs, ai)
-                if j > 0:
-                    aa[i] = dists[:j].sum() + (ai - threshs[j - 1]) / scales[j - 1]
+            aa[mask] = (
+                self._cumdists[j] + (aa[mask] - self._threshs[j]) / self._scales[j]
+            )
         return aa
 
 
@@ -12,18 +12,7 @@ import numpy as np
 
 from .config import rc
 from .internals import ic  # noqa: F401
-from .internals import _not_none, context, docstring
-
-try:
-    import cartopy.crs as ccrs
-    from cartopy.mpl.ticker import (
-        LatitudeFormatter,
-        LongitudeFormatter,
-        _PlateCarreeFormatter,
-    )
-except ModuleNotFoundError:
-    ccrs = None
-    LatitudeFormatter = LongitudeFormatter = _PlateCarreeFormatter = object
+from .internals import _not_none, caches, context, docstring, versions
 
 __all__ = [
     'IndexLocator',
@@ -45,6 +34,11 @@ __all__ = [
 REGEX_ZERO = re.compile('\\A[-\N{MINUS SIGN}]?0(.0*)?\\Z')
 REGEX_MINUS = re.compile('\\A[-\N{MINUS SIGN}]\\Z')
 REGEX_MINUS_ZERO = re.compile('\\A[-\N{MINUS SIGN}]0(.0*)?\\Z')
+TICKS_CACHE_SIZE = 8  # number of recently formatted tick values for each formatter
+_TICKS_STATE = (  # formatter attributes assigned by set_locs()
+    'locs', '_locs', 'offset', 'orderOfMagnitude', '_orderOfMagnitude',
+    'format', '_format',
+)
 
 _precision_docstring = """
 precision : int, default: {6, 2}
@@ -330,7 +324,73 @@ class LatitudeLocator(DegreeLocator):
         return [t for t in ticks if -90 <= t <= 90]
 
 
-class AutoFormatter(mticker.ScalarFormatter):
+class _TicksFormatter(object):
+    """
+    Mixin class for formatters that format every tick label at once and skip
+    formatting when the tick values and the settings are unchanged.
+    """
+    # NOTE: Matplotlib calls format_ticks() for the major and minor ticks every time
+    # an axis is drawn, including each get_tightbbox() call during the layout passes.
+    # Here the locale and the minus sign are looked up once per call and the labels
+    # are memoized along with the state assigned by set_locs(), e.g. the offset.
+    def format_ticks(self, values):
+        """
+        Return the tick labels for all the ticks at once.
+        """
+        values = np.asarray(values)
+        decimal_point = self._get_decimal_point()
+        unicode_minus = AutoFormatter._get_unicode_minus()
+        key = None
+        if values.dtype.kind in 'biuf':
+            key = (values.tobytes(), values.dtype.str, decimal_point, unicode_minus)
+            key += self._get_ticks_key()
+            try:
+                hash(key)
+            except TypeError:  # e.g. unusual user-input settings
+                key = None
+        try:
+            cache = self._ticks_cache
+        except AttributeError:
+            cache = self._ticks_cache = caches._LRUCache(TICKS_CACHE_SIZE)
+        result = cache.get(key) if key is not None else None
+        if result is None:
+            self.set_locs(values)
+            labels = self._format_ticks(values, decimal_point, unicode_minus)
+            state = {k: v for k, v in vars(self).items() if k in _TICKS_STATE}
+            result = (labels, state)
+            if key is not None:
+                cache.set(key, result)
+        labels, state = result
+        self.__dict__.update(state)
+        return list(labels)
+
+    def _format_ticks(self, values, decimal_point, unicode_minus):
+        """
+        Return the labels for the tick values.
+        """
+        return [
+            self._format_tick(x, pos, decimal_point, unicode_minus)
+            for pos, x in enumerate(values)
+        ]
+
+    def _get_decimal_point(self):
+        """
+        Get decimal point symbol for the current locale.
+        """
+        return AutoFormatter._get_default_decimal_point()
+
+    def _get_ticks_key(self):
+        """
+        Return the formatter settings that affect the tick labels.
+        """
+        return tuple(
+            tuple(value) if isinstance(value, list) else value
+            for key, value in vars(self).items()
+            if key[:1] == '_' and key not in _TICKS_STATE and key != '_ticks_cache'
+        )
+
+
+class AutoFormatter(_TicksFormatter, mticker.ScalarFormatter):
     """
     The default formatter used for proplot tick labels.
     Replaces `~matplotlib.ticker.ScalarFormatter`.
@@ -382,6 +442,14 @@ class AutoFormatter(mticker.ScalarFormatter):
         """
         %(ticker.call)s
         """
+        decimal_point = self._get_decimal_point()
+        unicode_minus = self._get_unicode_minus()
+        return self._format_tick(x, pos, decimal_point, unicode_minus)
+
+    def _format_tick(self, x, pos, decimal_point, unicode_minus):
+        """
+        Convert number to a string using the decimal point and minus sign setting.
+        """
         # Tick range limitation
         x = self._wrap_tick_range(x, self._wraprange)
         if self._outside_tick_range(x, self._tickrange):
@@ -394,12 +462,12 @@ class AutoFormatter(mticker.ScalarFormatter):
         string = super().__call__(x, pos)
 
         # Fix issue where non-zero string is formatted as zero
-        string = self._fix_small_number(x, string)
+        string = self._fix_small_number(x, string, decimal_point=decimal_point)
 
         # Custom string formatting
-        string = self._minus_format(string)
+        string = self._minus_format(string, unicode_minus)
         if self._zerotrim:
-            string = self._trim_trailing_zeros(string, self._get_decimal_point())
+            string = self._trim_trailing_zeros(string, decimal_point)
 
         # Prefix and suffix
         string = self._add_prefix_suffix(string, self._prefix, self._suffix)
@@ -425,7 +493,7 @@ class AutoFormatter(mticker.ScalarFormatter):
             sign, string = string[0], string[1:]
         return sign + prefix + string + suffix
 
-    def _fix_small_number(self, x, string, precision_offset=2):
+    def _fix_small_number(self, x, string, precision_offset=2, decimal_point=None):
         """
         Fix formatting for non-zero formatted as zero. The `offset` controls the offset
         from true floating point precision at which we want to limit string precision.
@@ -437,9 +505,9 @@ class AutoFormatter(mticker.ScalarFormatter):
         # precision. Common issue is e.g. levels=pplt.arange(-1, 1, 0.1).
         # This choice satisfies even 1000 additions of 0.1 to -100.
         m = REGEX_ZERO.match(string)
-        decimal_point = self._get_decimal_point()
-
         if m and x != 0:
+            decimal_point = decimal_point or self._get_decimal_point()
+
             # Get initial precision spit out by algorithm
             decimals, = m.groups()
             precision_init = len(decimals.lstrip(decimal_point)) if decimals else 0
@@ -476,6 +544,23 @@ class AutoFormatter(mticker.ScalarFormatter):
         use_locale = _not_none(use_locale, rc['formatter.use_locale'])
         return locale.localeconv()['decimal_point'] if use_locale else '.'
 
+    def _get_ticks_key(self):
+        """
+        Return the formatter settings and the view interval used for the offset.
+        """
+        interval = None
+        if self.axis is not None:
+            interval = tuple(self.axis.get_view_interval())
+        offset = None if self.get_useOffset() else self.offset
+        return super()._get_ticks_key() + (offset, interval)
+
+    @staticmethod
+    def _get_unicode_minus():
+        """
+        Return whether to use the unicode minus sign. Called externally.
+        """
+        return rc['axes.unicode_minus'] and not rc['text.usetex']
+
     @staticmethod
     def _decimal_place(x):
         """
@@ -488,11 +573,13 @@ class AutoFormatter(mticker.ScalarFormatter):
         return digits
 
     @staticmethod
-    def _minus_format(string):
+    def _minus_format(string, unicode_minus=None):
         """
         Format the minus sign and avoid "negative zero," e.g. ``-0.000``.
         """
-        if rc['axes.unicode_minus'] and not rc['text.usetex']:
+        if unicode_minus is None:
+            unicode_minus = AutoFormatter._get_unicode_minus()
+        if unicode_minus:
             string = string.replace('-', '\N{MINUS SIGN}')
         if REGEX_MINUS_ZERO.match(string):
             string = string[1:]
@@ -633,7 +720,7 @@ class IndexFormatter(mticker.Formatter):
             return self.labels[i]
 
 
-class SciFormatter(mticker.Formatter):
+class SciFormatter(_TicksFormatter, mticker.Formatter):
     """
     Format numbers with scientific notation.
     """
@@ -659,8 +746,15 @@ class SciFormatter(mticker.Formatter):
         """
         %(ticker.call)s
         """
+        decimal_point = self._get_decimal_point()
+        unicode_minus = AutoFormatter._get_unicode_minus()
+        return self._format_tick(x, pos, decimal_point, unicode_minus)
+
+    def _format_tick(self, x, pos, decimal_point, unicode_minus):  # noqa: U100
+        """
+        Convert number to a string using the decimal point and minus sign setting.
+        """
         # Get string
-        decimal_point = AutoFormatter._get_default_decimal_point()
         string = ('{:.%de}' % self._precision).format(x)
         parts = string.split('e')
 
@@ -680,13 +774,13 @@ class SciFormatter(mticker.Formatter):
             string = rf'{significand}{exponent}'
 
         # Ensure unicode minus sign
-        string = AutoFormatter._minus_format(string)
+        string = AutoFormatter._minus_format(string, unicode_minus)
 
         # Return TeX string
         return f'${string}$'
 
 
-class SigFigFormatter(mticker.Formatter):
+class SigFigFormatter(_TicksFormatter, mticker.Formatter):
     """
     Format numbers by retaining the specified number of significant digits.
     """
@@ -716,25 +810,55 @@ class SigFigFormatter(mticker.Formatter):
         """
         %(ticker.call)s
         """
+        decimal_point = self._get_decimal_point()
+        unicode_minus = AutoFormatter._get_unicode_minus()
+        return self._format_tick(x, pos, decimal_point, unicode_minus)
+
+    def _format_ticks(self, values, decimal_point, unicode_minus):
+        """
+        Return the labels for the tick values.
+        """
+        # NOTE: Get the decimal places for every value at once and the base decimal
+        # places only once. The values are rounded one at a time as in __call__.
+        with np.errstate(divide='ignore'):
+            digits = -np.floor(np.log10(np.abs(values.astype(float))))
+        digits[~np.isfinite(digits)] = 0  # zero has decimal place zero
+        digits = digits.astype(int) + self._sigfig - 1
+        offset = max(0, AutoFormatter._decimal_place(self._base))
+        labels = []
+        for pos, (x, d) in enumerate(zip(values.tolist(), digits.tolist())):
+            string = self._format_tick(x, pos, decimal_point, unicode_minus, d, offset)
+            labels.append(string)
+        return labels
+
+    def _format_tick(
+        self, x, pos, decimal_point, unicode_minus,  # noqa: U100
+        digits=None, offset=None,
+    ):
+        """
+        Convert number to a string using the decimal point and minus sign setting.
+        """
         # Limit to significant figures
-        digits = AutoFormatter._decimal_place(x) + self._sigfig - 1
+        if digits is None:
+            digits = AutoFormatter._decimal_place(x) + self._sigfig - 1
+        if offset is None:
+            offset = max(0, AutoFormatter._decimal_place(self._base))
         scale = self._base * 10 ** -digits
         x = scale * round(x / scale)
 
         # Create the string
-        decimal_point = AutoFormatter._get_default_decimal_point()
-        precision = max(0, digits) + max(0, AutoFormatter._decimal_place(self._base))
+        precision = max(0, digits) + offset
         string = ('{:.%df}' % precision).format(x)
         string = string.replace('.', decimal_point)
 
         # Custom string formatting
-        string = AutoFormatter._minus_format(string)
+        string = AutoFormatter._minus_format(string, unicode_minus)
         if self._zerotrim:
             string = AutoFormatter._trim_trailing_zeros(string, decimal_point)
         return string
 
 
-class FracFormatter(mticker.Formatter):
+class FracFormatter(_TicksFormatter, mticker.Formatter):
     r"""
     Format numbers as integers or integer fractions. Optionally express the
     values relative to some constant like `numpy.pi`.
@@ -767,6 +891,13 @@ class FracFormatter(mticker.Formatter):
         """
         %(ticker.call)s
         """
+        unicode_minus = AutoFormatter._get_unicode_minus()
+        return self._format_tick(x, pos, None, unicode_minus)
+
+    def _format_tick(self, x, pos, decimal_point, unicode_minus):  # noqa: U100
+        """
+        Convert number to a string using the minus sign setting.
+        """
         frac = Fraction(x / self._number).limit_denominator()
         symbol = self._symbol
         if x == 0:
@@ -785,11 +916,11 @@ class FracFormatter(mticker.Formatter):
                 string = f'-{symbol:s}/{frac.denominator:d}'
             else:  # and again make sure we use unicode minus!
                 string = f'{frac.numerator:d}{symbol:s}/{frac.denominator:d}'
-        string = AutoFormatter._minus_format(string)
+        string = AutoFormatter._minus_format(string, unicode_minus)
         return string
 
 
-class _CartopyFormatter(object):
+class _CartopyFormatter(versions._DeferredBases):
     """
     Mixin class for cartopy formatters.
     """
@@ -797,23 +928,31 @@ class _CartopyFormatter(object):
     # input values from map projection coordinates to Plate Carrée coordinates.
     # After 0.18 you can avoid this behavior by not setting axis but really
     # dislike that inconsistency. Solution is temporarily assign PlateCarre().
-    def __init__(self, *args, **kwargs):
-        import cartopy  # noqa: F401 (ensure available)
-        super().__init__(*args, **kwargs)
+    # NOTE: The cartopy base class named by _cartopy_base is only imported and
+    # appended to the bases on first instantiation. See _DeferredBases.
+    _cartopy_base = None
+
+    @classmethod
+    def _load_bases(cls):
+        from cartopy.mpl import ticker  # raises error if unavailable
+        return (getattr(ticker, cls._cartopy_base),), {}
 
     def __call__(self, value, pos=None):
         ctx = context._empty_context()
         if self.axis is not None:
-            ctx = context._state_context(self.axis.axes, projection=ccrs.PlateCarree())
+            from cartopy.crs import PlateCarree
+            ctx = context._state_context(self.axis.axes, projection=PlateCarree())
         with ctx:
             return super().__call__(value, pos)
 
 
-class DegreeFormatter(_CartopyFormatter, _PlateCarreeFormatter):
+class DegreeFormatter(_CartopyFormatter, mticker.Formatter):
     """
     Formatter for longitude and latitude gridline labels.
     Adapted from cartopy.
     """
+    _cartopy_base = '_PlateCarreeFormatter'
+
     @docstring._snippet_manager
     def __init__(self, *args, **kwargs):
         """
@@ -828,11 +967,13 @@ class DegreeFormatter(_CartopyFormatter, _PlateCarreeFormatter):
         return ''
 
 
-class LongitudeFormatter(_CartopyFormatter, LongitudeFormatter):
+class LongitudeFormatter(_CartopyFormatter, mticker.Formatter):
     """
     Format longitude gridline labels. Adapted from
     `cartopy.mpl.ticker.LongitudeFormatter`.
     """
+    _cartopy_base = 'LongitudeFormatter'
+
     @docstring._snippet_manager
     def __init__(self, *args, **kwargs):
         """
@@ -841,11 +982,13 @@ class LongitudeFormatter(_CartopyFormatter, LongitudeFormatter):
         super().__init__(*args, **kwargs)
 
 
-class LatitudeFormatter(_CartopyFormatter, LatitudeFormatter):
+class LatitudeFormatter(_CartopyFormatter, mticker.Formatter):
     """
     Format latitude gridline labels. Adapted from
     `cartopy.mpl.ticker.LatitudeFormatter`.
     """
+    _cartopy_base = 'LatitudeFormatter'
+
     @docstring._snippet_manager
     def __init__(self, *args, **kwargs):
         """
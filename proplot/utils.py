@@ -642,29 +642,9 @@ def to_rgba(color, space='rgb', cycle=None, clip=True):
     if len(color) == 4:
         *color, opacity = color
 
-    # Translate arbitrary colorspaces
-    if space == 'rgb':
-        if any(c > 2 for c in color):
-            color = tuple(c / 255 for c in color)  # scale to within 0-1
-        else:
-            pass
-    elif space == 'hsv':
-        color = hsluv.hsl_to_rgb(*color)
-    elif space == 'hcl':
-        color = hsluv.hcl_to_rgb(*color)
-    elif space == 'hsl':
-        color = hsluv.hsluv_to_rgb(*color)
-    elif space == 'hpl':
-        color = hsluv.hpluv_to_rgb(*color)
-    else:
-        raise ValueError(f'Invalid colorspace {space!r}.')
-
-    # Clip values. This should only be disabled when testing
-    # translation functions.
-    if clip:
-        color = np.clip(color, 0, 1)  # clip to valid range
-
-    # Return RGB or RGBA
+    # Translate arbitrary colorspaces and clip values. Clipping should
+    # only be disabled when testing translation functions.
+    color = _to_rgb_array(color, space=space, clip=clip)
     return (*color, opacity)
 
 
@@ -723,19 +703,53 @@ def to_xyza(color, space='hcl'):
     # NOTE: Don't pass color tuple, because we may want to permit
     # out-of-bounds RGB values to invert conversion
     *color, opacity = to_rgba(color)
+    color = _to_xyz_array(color, space=space)
+    return (*color, opacity)
+
+
+def _to_rgb_array(array, space='rgb', clip=True):
+    """
+    Translate an array of channel values with trailing dimension 3 from
+    the colorspace `space` to RGB. This is the vectorized engine behind `to_rgba`.
+    """
+    array = np.asarray(array, dtype=float)
+    if space == 'rgb':
+        scale = np.any(array > 2, axis=-1, keepdims=True)
+        array = np.where(scale, array / 255, array)  # scale to within 0-1
+    elif space == 'hsv':
+        array = hsluv.hsl_to_rgb_array(array)
+    elif space == 'hcl':
+        array = hsluv.hcl_to_rgb_array(array)
+    elif space == 'hsl':
+        array = hsluv.hsluv_to_rgb_array(array)
+    elif space == 'hpl':
+        array = hsluv.hpluv_to_rgb_array(array)
+    else:
+        raise ValueError(f'Invalid colorspace {space!r}.')
+    if clip:
+        array = np.clip(array, 0, 1)  # clip to valid range
+    return array
+
+
+def _to_xyz_array(array, space='hcl'):
+    """
+    Translate an array of RGB values with trailing dimension 3 to the
+    colorspace `space`. This is the vectorized engine behind `to_xyza`.
+    """
+    array = np.asarray(array, dtype=float)
     if space == 'rgb':
         pass
     elif space == 'hsv':
-        color = hsluv.rgb_to_hsl(*color)  # rgb_to_hsv would also work
+        array = hsluv.rgb_to_hsl_array(array)  # rgb_to_hsv would also work
     elif space == 'hcl':
-        color = hsluv.rgb_to_hcl(*color)
+        array = hsluv.rgb_to_hcl_array(array)
     elif space == 'hsl':
-        color = hsluv.rgb_to_hsluv(*color)
+        array = hsluv.rgb_to_hsluv_array(array)
     elif space == 'hpl':
-        color = hsluv.rgb_to_hpluv(*color)
+        array = hsluv.rgb_to_hpluv_array(array)
     else:
         raise ValueError(f'Invalid colorspace {space}.')
-    return (*color, opacity)
+    return array
 
 
 def _fontsize_to_pt(size):